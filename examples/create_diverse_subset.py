@@ -31,6 +31,7 @@ from __future__ import annotations
 import argparse
 import json
 import shutil
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -249,9 +250,17 @@ def main() -> None:
     report_path = output_dir / "diversity_report.json"
     report_path.write_text(json.dumps(report, indent=2))
 
-    print(f"\nDone — {len(selected_indices)} pairs saved to {output_dir}")
-    print(f"Diversity report: {report_path}")
-    print(json.dumps(report, indent=2))
+    # Emit the final summary in one buffered write instead of print-per-line
+    sys.stdout.write(
+        "\n".join(
+            [
+                f"\nDone — {len(selected_indices)} pairs saved to {output_dir}",
+                f"Diversity report: {report_path}",
+                json.dumps(report, indent=2),
+                "",
+            ]
+        )
+    )
 
 
 if __name__ == "__main__":
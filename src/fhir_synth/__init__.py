@@ -1,7 +1,5 @@
 """FHIR Synth - Dynamic FHIR synthetic data generator (supports R4B, STU3)."""
 
-from dotenv import load_dotenv
-
 from fhir_synth.fhir_spec import (
     class_to_module,
     get_resource_class,
@@ -13,10 +11,9 @@ from fhir_synth.fhir_spec import (
 
 __version__ = "1.21.0"
 
-# Load environment variables from .env file at package init
-# This ensures API keys and other env vars are available when using as a library
-load_dotenv()
-
+# `.env` loading is deferred: the CLI callback and `llm.get_provider`
+# each load it right before credentials are needed, so importing the
+# package (or `--help`) never pays for dotenv discovery.
 
 __all__ = [
     "__version__",
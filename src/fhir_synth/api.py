@@ -0,0 +1,85 @@
+"""Programmatic entry points that bypass the CLI layer.
+
+Typer/Click argument parsing and option validation add measurable
+per-invocation overhead; in-process callers (scripts, notebooks, servers)
+can use these directly. Generator instances are cached per configuration
+so repeated calls keep litellm's client state and the executor warm —
+the CLI shares the same cache.
+"""
+
+from typing import Any
+
+_GENERATOR_CACHE: dict[tuple[str, str, str, str | None, str | None], Any] = {}
+
+
+def get_code_generator(
+    provider: str = "gpt-4",
+    fhir_version: str = "R4B",
+    executor_backend: str = "local",
+    aws_profile: str | None = None,
+    aws_region: str | None = None,
+) -> Any:
+    """Return a `CodeGenerator` for this configuration, reusing prior instances.
+
+    Args:
+        provider: LLM model/provider name (litellm syntax; `"mock"` for tests).
+        fhir_version: FHIR version (R4B, STU3).
+        executor_backend: One of `"local"`, `"docker"`, `"e2b"`, `"blaxel"`.
+        aws_profile: AWS profile for Bedrock providers.
+        aws_region: AWS region for Bedrock providers.
+    """
+    from fhir_synth import fhir_spec
+
+    key = (provider, fhir_version, executor_backend, aws_profile, aws_region)
+    code_gen = _GENERATOR_CACHE.get(key)
+    if code_gen is None:
+        from fhir_synth.code_generator import CodeGenerator, get_executor
+        from fhir_synth.llm import get_provider
+
+        llm = get_provider(provider, aws_profile=aws_profile, aws_region=aws_region)
+        code_gen = CodeGenerator(
+            llm,
+            max_retries=2,
+            executor=get_executor(executor_backend),
+            fhir_version=fhir_version,
+        )
+        _GENERATOR_CACHE[key] = code_gen
+    else:
+        # Prompt builders read the global spec version; a generator built
+        # under another version may have switched it since this instance
+        # was cached, so re-assert it on every reuse.
+        fhir_spec.set_fhir_version(fhir_version)
+    return code_gen
+
+
+def generate(
+    prompt: str,
+    *,
+    provider: str = "gpt-4",
+    fhir_version: str = "R4B",
+    executor_backend: str = "local",
+    use_cache: bool = True,
+    cache_ttl: float | None = None,
+    timeout: int = 30,
+) -> list[dict[str, Any]]:
+    """Generate FHIR resources for *prompt* and return them as dicts.
+
+    The in-process equivalent of `fhir-synth generate` minus run-directory
+    bookkeeping: prompt → code (template fast path / cache / LLM) →
+    sandboxed execution → resource dicts.
+
+    Args:
+        prompt: Natural language description of resources to generate.
+        provider: LLM model/provider name.
+        fhir_version: FHIR version (R4B, STU3).
+        executor_backend: Executor backend for running generated code.
+        use_cache: Consult/populate the on-disk code cache.
+        cache_ttl: Maximum cache-entry age in seconds (None = no expiry).
+        timeout: Execution timeout in seconds.
+
+    Returns:
+        List of FHIR resource dicts.
+    """
+    code_gen = get_code_generator(provider, fhir_version, executor_backend)
+    code = code_gen.generate_code_from_prompt(prompt, use_cache=use_cache, cache_ttl=cache_ttl)
+    return code_gen.execute_generated_code(code, timeout=timeout)  # type: ignore[no-any-return]
@@ -4,6 +4,7 @@ from fhir_synth.bundle.builder import BundleBuilder
 from fhir_synth.bundle.factory import BundleFactory
 from fhir_synth.bundle.manager import BundleManager
 from fhir_synth.bundle.splitter import (
+    iter_split_bundles,
     split_resources_by_patient,
     write_ndjson,
     write_split_bundles,
@@ -13,6 +14,7 @@ __all__ = [
     "BundleBuilder",
     "BundleFactory",
     "BundleManager",
+    "iter_split_bundles",
     "split_resources_by_patient",
     "write_ndjson",
     "write_split_bundles",
@@ -1,26 +1,117 @@
 """FHIR Bundle builder for combining multiple resources."""
 
+import json
+import os
+import random
+import threading
+import time
 import uuid
 from datetime import UTC, datetime
-from typing import Any
+from functools import cache
+from typing import Any, BinaryIO
+
+from fhir_synth.fhir_spec import reference_targets, resource_names
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize *obj* to compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
 
-from fhir_synth.fhir_spec import reference_targets
 
 # Fields that typically hold a Patient reference (subject, patient, etc.)
 _PATIENT_REF_FIELDS = ("subject", "patient")
 
 
+@cache
+def _build_patient_ref_index() -> dict[str, str | None]:
+    """Map every resource type to its patient-reference field (or None).
+
+    Built once on first use (`fhir_spec` discovery is lazy, so doing this
+    at import would drag the full resource scan into CLI startup) and
+    cached, turning the hot-path lookup into a single dict hit.
+    """
+    index: dict[str, str | None] = {}
+    for rt in resource_names():
+        try:
+            ref_fields = reference_targets(rt)
+        except ValueError:
+            index[rt] = None
+            continue
+        index[rt] = next((f for f in _PATIENT_REF_FIELDS if f in ref_fields), None)
+    return index
+
+
+def _patient_ref_field(resource_type: str) -> str | None:
+    """First patient-reference field that *resource_type* accepts, or None."""
+    return _build_patient_ref_index().get(resource_type)
+
+
+class _IdPool:
+    """Batched random-ID source.
+
+    `uuid.uuid4()` reads 16 bytes from `os.urandom` per call; for bundles
+    with thousands of entries the syscall overhead adds up.  This pool
+    reads 16 KiB at a time and slices UUID4s out of the buffer.  The
+    module-level instance is shared across builders, so the buffer
+    advance is guarded by a lock — unlike `uuid.uuid4()`, an unlocked
+    read-modify-write could hand two threads the same bytes.
+    """
+
+    __slots__ = ("_buf", "_lock", "_pos")
+
+    _REFILL_SIZE = 16384
+
+    def __init__(self) -> None:
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def next_id(self) -> str:
+        with self._lock:
+            if self._pos >= len(self._buf):
+                self._buf = os.urandom(self._REFILL_SIZE)
+                self._pos = 0
+            raw = bytearray(self._buf[self._pos : self._pos + 16])
+            self._pos += 16
+        raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+        return str(uuid.UUID(bytes=bytes(raw)))
+
+
+_ID_POOL = _IdPool()
+
+# 1-entry timestamp memo: epoch second → formatted ISO string
+_TS_SECOND = 0
+_TS_ISO = ""
+
+
 class BundleBuilder:
     """Build FHIR Bundles from generated resources."""
 
-    def __init__(self, bundle_type: str = "transaction") -> None:
+    __slots__ = ("bundle_type", "entries", "_rng")
+
+    def __init__(
+        self,
+        bundle_type: str = "transaction",
+        rng: random.Random | None = None,
+    ) -> None:
         """Initialize bundle builder.
 
         Args:
             bundle_type: Type of bundle (transaction, batch, searchset, collection, etc.)
+            rng: Optional seeded random generator for reproducible bundle/entry
+                IDs (same seed = same IDs). Defaults to non-deterministic UUIDs.
         """
         self.bundle_type = bundle_type
         self.entries: list[dict[str, Any]] = []
+        self._rng = rng
 
     def add_resource(
         self,
@@ -39,10 +130,10 @@ class BundleBuilder:
         resource_id = resource.get("id")
 
         if url is None:
-            url = f"{resource_type}" + (f"/{resource_id}" if resource_id else "")
+            url = resource_type if not resource_id else f"{resource_type}/{resource_id}"
 
         entry = {
-            "fullUrl": f"urn:uuid:{resource_id or self._generate_id()}",
+            "fullUrl": "urn:uuid:" + (resource_id or self._generate_id()),
             "resource": resource,
             "request": {
                 "method": method,
@@ -59,12 +150,28 @@ class BundleBuilder:
     ) -> None:
         """Add multiple resources to the bundle.
 
+        Bulk path — builds all entries in one comprehension and extends
+        `self.entries` once, skipping the per-call overhead of
+        `add_resource`.
+
         Args:
             resources: List of FHIR resource dictionaries
             method: HTTP method for all resources
         """
-        for resource in resources:
-            self.add_resource(resource, method)
+        gen_id = self._generate_id
+        self.entries.extend(
+            [
+                {
+                    "fullUrl": "urn:uuid:" + ((rid := r.get("id")) or gen_id()),
+                    "resource": r,
+                    "request": {
+                        "method": method,
+                        "url": rt + "/" + rid if (rt := r.get("resourceType")) and rid else rt,
+                    },
+                }
+                for r in resources
+            ]
+        )
 
     def build(self) -> dict[str, Any]:
         """Build and return the bundle.
@@ -83,6 +190,34 @@ class BundleBuilder:
 
         return bundle
 
+    def build_stream(self, fp: BinaryIO) -> None:
+        """Serialize the bundle straight to a binary file object.
+
+        Writes the Bundle envelope, then streams each entry one at a
+        time — the full outer dict and its JSON string are never
+        materialized, keeping peak memory at O(one entry) for very
+        large bundles.
+
+        Args:
+            fp: Writable binary file object (e.g. `path.open("wb")`)
+        """
+        envelope = _dumps(
+            {
+                "resourceType": "Bundle",
+                "id": self._generate_id(),
+                "type": self.bundle_type,
+                "timestamp": self._current_timestamp(),
+                "total": len(self.entries),
+            }
+        )
+        # Re-open the envelope's closing brace and splice in the entry array
+        fp.write(envelope[:-1] + b',"entry":[')
+        for i, entry in enumerate(self.entries):
+            if i:
+                fp.write(b",")
+            fp.write(_dumps(entry))
+        fp.write(b"]}")
+
     def build_with_relationships(
         self,
         resources_by_type: dict[str, list[dict[str, Any]]],
@@ -102,49 +237,47 @@ class BundleBuilder:
                 str(rid) for r in resources if (rid := r.get("id")) is not None
             ]
 
-        # Add resources and establish relationships
+        # Build the patient reference once per batch; every linked resource
+        # shares the same dict instead of allocating one per resource.
+        patient_ids = references.get("Patient")
+        patient_ref = {"reference": f"Patient/{patient_ids[0]}"} if patient_ids else None
+
+        # Add resources and establish relationships.  The patient-ref field
+        # depends only on the resource type, so resolve it once per type
+        # instead of once per resource.
         for resource_type, resources in resources_by_type.items():
+            target_field = (
+                _patient_ref_field(resource_type)
+                if resource_type != "Patient" and patient_ref is not None
+                else None
+            )
             for resource in resources:
-                self._add_resource_with_refs(resource, references, resource_type)
+                if target_field is not None and target_field not in resource:
+                    resource[target_field] = patient_ref
+                self.add_resource(resource)
 
         return self.build()
 
-    def _add_resource_with_refs(
-        self,
-        resource: dict[str, Any],
-        references: dict[str, list[str]],
-        primary_type: str,
-    ) -> None:
-        """Add resource and inject references where appropriate.
-
-        Uses `fhir_spec.reference_targets` to discover which fields on
-        *primary_type* accept references, then auto-links to Patient (or
-        other available resources) if IDs exist.
-        """
-        if primary_type != "Patient" and "Patient" in references and references["Patient"]:
-            patient_id = references["Patient"][0]
-            # Check if this resource type has subject/patient reference fields
-            try:
-                ref_fields = reference_targets(primary_type)
-                for ref_field in _PATIENT_REF_FIELDS:
-                    if ref_field in ref_fields and ref_field not in resource:
-                        resource[ref_field] = {"reference": f"Patient/{patient_id}"}
-                        break
-            except ValueError:
-                pass
-
-        self.add_resource(resource)
-
     def clear(self) -> None:
         """Clear all entries from builder."""
         self.entries = []
 
-    @staticmethod
-    def _generate_id() -> str:
-        """Generate a unique ID."""
-        return str(uuid.uuid4())
+    def _generate_id(self) -> str:
+        """Generate a unique ID (deterministic when an rng was provided)."""
+        if self._rng is not None:
+            return str(uuid.UUID(bytes=self._rng.randbytes(16), version=4))
+        return _ID_POOL.next_id()
 
     @staticmethod
     def _current_timestamp() -> str:
-        """Get the current timestamp in ISO format."""
-        return datetime.now(UTC).isoformat() + "Z"
+        """Get the current timestamp in ISO format.
+
+        Cached per wall-clock second so build() loops skip repeated
+        datetime construction and formatting.
+        """
+        global _TS_SECOND, _TS_ISO
+        t = int(time.time())
+        if t != _TS_SECOND:
+            _TS_SECOND = t
+            _TS_ISO = datetime.fromtimestamp(t, UTC).isoformat() + "Z"
+        return _TS_ISO
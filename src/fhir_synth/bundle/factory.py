@@ -1,8 +1,25 @@
 """Bundle factory for building FHIR Bundles with Pydantic models."""
 
+import random
+import uuid
+from datetime import UTC, datetime
+from functools import cache
+from itertools import groupby
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+
+
+@cache
+def _list_adapter(model_cls: type[BaseModel]) -> TypeAdapter[Any]:
+    """Reusable batched dumper for a model class.
+
+    Dumping a whole `list[Model]` through one adapter is cheaper than
+    calling `model_dump` per instance on homogeneous batches.
+    """
+    # list[model_cls] is constructed at runtime from a variable, which
+    # mypy cannot treat as a type expression.
+    return TypeAdapter(list[model_cls])  # type: ignore[valid-type]
 
 
 class BundleFactory:
@@ -12,14 +29,28 @@ class BundleFactory:
     automatically converting models to dicts.
     """
 
-    def __init__(self, bundle_type: str = "transaction") -> None:
+    def __init__(
+        self,
+        bundle_type: str = "transaction",
+        rng: random.Random | None = None,
+    ) -> None:
         """Initialize bundle factory.
 
         Args:
             bundle_type: Type of bundle to create
+            rng: Optional seeded random generator for reproducible bundle
+                IDs (same seed = same IDs). Defaults to non-deterministic UUIDs.
         """
         self.bundle_type = bundle_type
         self.entries: list[dict[str, Any]] = []
+        self._rng = rng
+        self._bundle_id: str | None = None
+
+    def _generate_id(self) -> str:
+        """Generate a unique ID (deterministic when an rng was provided)."""
+        if self._rng is not None:
+            return str(uuid.UUID(bytes=self._rng.randbytes(16), version=4))
+        return str(uuid.uuid4())
 
     def add_resource(
         self,
@@ -60,12 +91,69 @@ class BundleFactory:
     ) -> None:
         """Add multiple resources to the bundle.
 
+        Bulk path — hoists loop locals and inlines entry construction so
+        large batches skip the per-call overhead of `add_resource`.
+
         Args:
             resources: List of FHIR resources
             method: HTTP method for all resources
         """
-        for resource in resources:
-            self.add_resource(resource, method)
+        entries_append = self.entries.append
+        # Group consecutive resources by class so homogeneous model runs are
+        # dumped in one batched TypeAdapter call instead of per instance.
+        for model_cls, group in groupby(resources, key=type):
+            if issubclass(model_cls, BaseModel):
+                dicts = _list_adapter(model_cls).dump_python(
+                    list(group), exclude_none=True, by_alias=True
+                )
+            else:
+                dicts = group
+            for resource_dict in dicts:
+                resource_type = resource_dict.get("resourceType")
+                resource_id = resource_dict.get("id")
+                entries_append(
+                    {
+                        "fullUrl": f"urn:uuid:{resource_id}",
+                        "resource": resource_dict,
+                        "request": {
+                            "method": method,
+                            "url": f"{resource_type}/{resource_id}"
+                            if resource_id
+                            else f"{resource_type}",
+                        },
+                    }
+                )
+
+    def add_dict_resources(
+        self,
+        resources: list[dict[str, Any]],
+        method: str = "POST",
+    ) -> None:
+        """Add multiple dict resources to the bundle.
+
+        Fast path for callers that already hold plain dicts — skips the
+        per-resource model check and dump entirely.
+
+        Args:
+            resources: List of FHIR resource dicts
+            method: HTTP method for all resources
+        """
+        entries_append = self.entries.append
+        for resource_dict in resources:
+            resource_type = resource_dict.get("resourceType")
+            resource_id = resource_dict.get("id")
+            entries_append(
+                {
+                    "fullUrl": f"urn:uuid:{resource_id}",
+                    "resource": resource_dict,
+                    "request": {
+                        "method": method,
+                        "url": f"{resource_type}/{resource_id}"
+                        if resource_id
+                        else f"{resource_type}",
+                    },
+                }
+            )
 
     def build(self) -> dict[str, Any]:
         """Build the FHIR Bundle as a dictionary.
@@ -73,12 +161,14 @@ class BundleFactory:
         Returns:
             Complete FHIR Bundle resource as dict
         """
-        import uuid
-        from datetime import UTC, datetime
+        # Bundle ID is stable per factory — repeated build() calls during
+        # incremental assembly reuse it instead of regenerating.
+        if self._bundle_id is None:
+            self._bundle_id = self._generate_id()
 
         return {
             "resourceType": "Bundle",
-            "id": str(uuid.uuid4()),
+            "id": self._bundle_id,
             "type": self.bundle_type,
             "timestamp": datetime.now(UTC).isoformat(),
             "total": len(self.entries),
@@ -100,3 +190,4 @@ class BundleFactory:
     def clear(self) -> None:
         """Clear all entries."""
         self.entries = []
+        self._bundle_id = None
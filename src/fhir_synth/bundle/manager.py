@@ -6,6 +6,8 @@ from typing import Any
 class BundleManager:
     """Manage creation and validation of FHIR Bundles."""
 
+    __slots__ = ()
+
     # noinspection PyMethodMayBeStatic
     def validate_bundle(self, bundle: dict[str, Any]) -> tuple[bool, list[str]]:
         """Validate bundle structure.
@@ -18,7 +20,8 @@ class BundleManager:
         """
         errors = []
 
-        # Check required fields
+        # Check required fields — structural problems short-circuit before
+        # the (potentially large) per-entry scan
         if bundle.get("resourceType") != "Bundle":
             errors.append("Bundle must have resourceType='Bundle'")
 
@@ -28,13 +31,23 @@ class BundleManager:
         if "entry" not in bundle:
             errors.append("Bundle must have entries")
 
-        # Check entries
-        for i, entry in enumerate(bundle.get("entry", [])):
-            if "resource" not in entry:
-                errors.append(f"Entry {i} missing 'resource'")
-            else:
-                resource = entry["resource"]
-                if "resourceType" not in resource:
-                    errors.append(f"Entry {i} resource missing 'resourceType'")
+        if errors:
+            return False, errors
+
+        # Fast path — one C-level all() pass with no error-string building;
+        # the vast majority of bundles validate cleanly.
+        entries = bundle["entry"]
+        if all("resource" in e and "resourceType" in e["resource"] for e in entries):
+            return True, []
+
+        # Slow path — collect specific per-entry errors
+        errors = [
+            f"Entry {i} missing 'resource'" for i, e in enumerate(entries) if "resource" not in e
+        ]
+        errors += [
+            f"Entry {i} resource missing 'resourceType'"
+            for i, e in enumerate(entries)
+            if "resource" in e and "resourceType" not in e["resource"]
+        ]
 
         return len(errors) == 0, errors
@@ -1,10 +1,17 @@
 """Split a flat list of FHIR resources into per-patient bundles."""
 
 import json
-import re
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
 
 def _extract_patient_id(resource: dict[str, Any]) -> str | None:
     """Extract the patient ID a resource belongs to.
@@ -13,106 +20,160 @@ def _extract_patient_id(resource: dict[str, Any]) -> str | None:
     from `subject` / `patient` / `beneficiary` fields for others.
     """
     if resource.get("resourceType") == "Patient":
-        return resource.get("id")
+        patient_id: str | None = resource.get("id")
+        return patient_id
 
     for field in ("subject", "patient", "beneficiary"):
         ref = resource.get(field)
         if isinstance(ref, dict):
-            reference = ref.get("reference", "")
-            match = re.match(r"Patient/(.+)", reference)
-            if match:
-                return match.group(1)
+            reference: str = ref.get("reference", "")
+            if reference.startswith("Patient/") and len(reference) > 8:
+                return reference[8:]
 
     return None
 
 
-def split_resources_by_patient(
+def iter_split_bundles(
     resources: list[dict[str, Any]],
-) -> list[dict[str, Any]]:
-    """Split a flat resource list into one Bundle per patient.
-
-    Each bundle contains the Patient resource plus all resources that
-    reference that patient.  Resources that cannot be linked to any
-    patient (e.g. Organization, Practitioner) are included in **every**
-    patient bundle, so each bundle is self-contained.
+    shared_unlinked: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Yield per-patient Bundles one at a time.
 
-    Returns:
-        List of FHIR Bundle dicts (`type: collection`).
+    Streaming counterpart of `split_resources_by_patient` — bundle dicts
+    are built lazily, so writers can serialize each one and drop it
+    instead of materializing every bundle at once.
     """
-    patient_ids: list[str] = []
+    # Insertion order of the dict preserves patient order — no separate
+    # id list needed.
     patient_resources: dict[str, list[dict[str, Any]]] = {}
     unlinked: list[dict[str, Any]] = []
 
-    # First pass — collect Patient resources (preserving order)
+    # Single pass — collect Patient resources (preserving order) and hold
+    # everything else until all patients are known, so a resource may
+    # reference a patient that appears later in the list.
+    held: list[tuple[str | None, dict[str, Any]]] = []
     for r in resources:
         if r.get("resourceType") == "Patient":
-            pid = r.get("id", f"unknown-{len(patient_ids)}")
-            if pid not in patient_resources:
-                patient_ids.append(pid)
-                patient_resources[pid] = []
-            patient_resources[pid].append(r)
+            pid = r.get("id", f"unknown-{len(patient_resources)}")
+            patient_resources.setdefault(pid, []).append(r)
+        else:
+            held.append((_extract_patient_id(r), r))
 
-    # Second pass — assign non-Patient resources to their patient
-    for r in resources:
-        if r.get("resourceType") == "Patient":
-            continue
-        pid = _extract_patient_id(r)
+    # Deferred pass — attach held resources to their patient (or unlinked)
+    for pid, r in held:
         if pid and pid in patient_resources:
             patient_resources[pid].append(r)
         else:
             unlinked.append(r)
 
-    # Build one Bundle per patient
-    bundles: list[dict[str, Any]] = []
-    for pid in patient_ids:
-        entries = patient_resources[pid] + unlinked
-        bundles.append(
-            {
-                "resourceType": "Bundle",
-                "type": "collection",
-                "total": len(entries),
-                "entry": [{"resource": r} for r in entries],
-            }
-        )
-
-    # Edge case: no patients found — return everything in one bundle
-    if not bundles and resources:
-        bundles.append(
-            {
+    # Edge case: no patients found — yield everything in one bundle
+    if not patient_resources:
+        if resources:
+            yield {
                 "resourceType": "Bundle",
                 "type": "collection",
                 "total": len(resources),
                 "entry": [{"resource": r} for r in resources],
             }
-        )
+        return
+
+    # Yield one Bundle per patient.  Wrap the unlinked resources once and
+    # share the entry dicts across bundles instead of re-wrapping them for
+    # every patient.
+    unlinked_entries = [{"resource": r} for r in unlinked] if shared_unlinked else []
+    for linked in patient_resources.values():
+        entries = [{"resource": r} for r in linked] + unlinked_entries
+        yield {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "total": len(entries),
+            "entry": entries,
+        }
+
+    if not shared_unlinked and unlinked:
+        yield {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "total": len(unlinked),
+            "entry": [{"resource": r} for r in unlinked],
+        }
+
 
-    return bundles
+def split_resources_by_patient(
+    resources: list[dict[str, Any]],
+    shared_unlinked: bool = True,
+) -> list[dict[str, Any]]:
+    """Split a flat resource list into one Bundle per patient.
+
+    Each bundle contains the Patient resource plus all resources that
+    reference that patient.  Resources that cannot be linked to any
+    patient (e.g. Organization, Practitioner) are included in **every**
+    patient bundle by default, so each bundle is self-contained.  Pass
+    ``shared_unlinked=False`` to instead emit one extra "shared" bundle
+    holding the unlinked resources, which avoids duplicating them across
+    hundreds of patient bundles on bulk-load runs.
+
+    Returns:
+        List of FHIR Bundle dicts (`type: collection`).
+    """
+    return list(iter_split_bundles(resources, shared_unlinked=shared_unlinked))
+
+
+def _dump_bundle(bundle: dict[str, Any], pretty: bool) -> bytes:
+    """Serialize a single bundle to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(bundle, option=option, default=str)
+    if pretty:
+        return json.dumps(bundle, indent=2, default=str).encode("utf-8")
+    return json.dumps(bundle, separators=(",", ":"), default=str).encode("utf-8")
 
 
 def write_split_bundles(
-    bundles: list[dict[str, Any]],
+    bundles: Iterable[dict[str, Any]],
     output_dir: Path,
+    pretty: bool = False,
 ) -> list[Path]:
     """Write each patient bundle to a separate JSON file.
 
     Files are named `patient_001.json`, `patient_002.json`, etc.
+    Accepts any iterable (e.g. `iter_split_bundles`) and writes each
+    bundle as it arrives, keeping only one bundle in memory at a time.
+    Output is compact by default; pass ``pretty=True`` for indented JSON
+    when human-readable files are needed.  Files are serialized and
+    written on a thread pool — the GIL is released during encoding and
+    `os.write`, so hundreds of independent files land in parallel.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    paths: list[Path] = []
-    for i, bundle in enumerate(bundles, 1):
+
+    def _write(item: tuple[int, dict[str, Any]]) -> Path:
+        i, bundle = item
         path = output_dir / f"patient_{i:03d}.json"
-        path.write_text(json.dumps(bundle, indent=2, default=str))
-        paths.append(path)
-    return paths
+        path.write_bytes(_dump_bundle(bundle, pretty))
+        return path
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        # map() preserves input order, so paths stay patient_001, 002, …
+        return list(pool.map(_write, enumerate(bundles, 1)))
 
 
 def write_ndjson(
-    bundles: list[dict[str, Any]],
+    bundles: Iterable[dict[str, Any]],
     output_path: Path,
 ) -> Path:
-    """Write bundles as NDJSON — one JSON bundle per line."""
+    """Write bundles as NDJSON — one JSON bundle per line.
+
+    Writes through a large binary buffer so bulk-load outputs (hundreds of
+    patient bundles) flush in ~1 MB chunks instead of one syscall per line.
+    Uses orjson when available; falls back to a reused stdlib encoder.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w") as f:
-        for bundle in bundles:
-            f.write(json.dumps(bundle, default=str) + "\n")
+    with output_path.open("wb", buffering=1 << 20) as f:
+        if orjson is not None:
+            for bundle in bundles:
+                f.write(orjson.dumps(bundle, default=str) + b"\n")
+        else:
+            encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+            for bundle in bundles:
+                f.write((encode(bundle) + "\n").encode("utf-8"))
     return output_path
@@ -1,24 +1,59 @@
 """FHIR Synth CLI - Generate synthetic FHIR data from natural language prompts (supports R4B, STU3)."""
 
 import asyncio
-import json
+import re
 import sys
+from enum import StrEnum
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any
 
 import typer
-from dotenv import load_dotenv
-
-from fhir_synth.reporter import TyperReporter
-
-# Load environment variables from .env
-load_dotenv()
 
 app = typer.Typer(
     help="Dynamic FHIR synthetic data generator — prompt → code → data (supports R4B, STU3)"
 )
 
 
+class BundleType(StrEnum):
+    """Bundle types the CLI can produce — validated by typer at parse time."""
+
+    transaction = "transaction"
+    batch = "batch"
+    collection = "collection"
+    document = "document"
+    searchset = "searchset"
+
+
+@app.callback()
+def _init(ctx: typer.Context) -> None:
+    """Load `.env` before any command runs.
+
+    Deferred from import time so `fhir-synth --help` (and shell
+    completion) doesn't pay for dotenv discovery and file parsing;
+    skipped entirely when no subcommand will run (bare `fhir-synth`,
+    `--help` on the app itself).
+    """
+    if ctx.invoked_subcommand is None:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _install_uvloop() -> None:
+    """Swap in uvloop's event loop when installed (`pip install fhir-synth[fast]`).
+
+    Silent no-op when unavailable (e.g. Windows) — the stdlib loop is
+    functionally identical, just slower under concurrent I/O.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 def _configure_skills(
     skills_dir: str | None,
     selector: str,
@@ -55,6 +90,112 @@ def _configure_skills(
     return get_skill_discovery_summary()
 
 
+_SYS_SPLIT = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=32)
+def _parse_systems(csv: str) -> tuple[str, ...]:
+    """Parse a comma-separated --systems value into a tuple of system ids.
+
+    Returns the default ("emr1", "emr2") when the value is empty. Cached —
+    the same CSV string is parsed once per process, and the tuple is
+    hashable for downstream caches. The precompiled split handles the
+    surrounding whitespace in one pass instead of a strip per token.
+    """
+    return tuple(x for x in _SYS_SPLIT.split(csv.strip()) if x) or ("emr1", "emr2")
+
+
+def _handle_errors(fn: Any) -> Any:
+    """Report uncaught command errors uniformly and exit non-zero.
+
+    Replaces the per-command `try/except Exception` boilerplate; the
+    wrapped body stays flat and new commands get the same UX for free.
+    """
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as exc:
+            typer.echo(f"Error: {exc}", err=True)
+            raise typer.Exit(1) from exc
+
+    return wrapper
+
+
+def _get_code_gen(
+    provider: str,
+    fhir_version: str,
+    executor_backend: str = "local",
+    aws_profile: str | None = None,
+    aws_region: str | None = None,
+) -> Any:
+    """Return a `CodeGenerator` for this configuration, reusing prior instances.
+
+    Delegates to :func:`fhir_synth.api.get_code_generator`, so CLI commands
+    and programmatic callers share one warm-instance cache.
+    """
+    from fhir_synth.api import get_code_generator
+
+    return get_code_generator(
+        provider,
+        fhir_version,
+        executor_backend,
+        aws_profile=aws_profile,
+        aws_region=aws_region,
+    )
+
+
+def _cached_generate_code(
+    code_gen: Any,
+    prompt_text: str,
+    no_cache: bool = False,
+    cache_ttl: float | None = None,
+    semantic: bool = False,
+    similarity_threshold: float = 0.92,
+) -> str:
+    """Generate code for a prompt, consulting the on-disk caches first.
+
+    Exact-match caching lives inside
+    :meth:`CodeGenerator.generate_code_from_prompt` (keyed on model +
+    prompts); `--no-cache` bypasses it. With `--semantic-cache`, reworded
+    prompts that embed close to a prior prompt also hit (see
+    :mod:`fhir_synth.semantic_cache`).
+    """
+    if no_cache:
+        return code_gen.generate_code_from_prompt(  # type: ignore[no-any-return]
+            prompt_text, use_cache=False
+        )
+
+    sem_cache = None
+    if semantic:
+        from fhir_synth.semantic_cache import SemanticCache
+
+        sem_cache = SemanticCache(
+            threshold=similarity_threshold,
+            llm_model=code_gen.llm.model,
+            fhir_version=code_gen.fhir_version,
+        )
+        cached = sem_cache.lookup(prompt_text)
+        if cached is not None:
+            return cached
+
+    code: str = code_gen.generate_code_from_prompt(prompt_text, cache_ttl=cache_ttl)
+    if sem_cache is not None:
+        sem_cache.store(prompt_text, code)
+    return code
+
+
+@app.command()
+def examples() -> None:
+    """Show example prompts and flag combinations for `generate`."""
+    from fhir_synth.help_examples import format_examples
+
+    typer.echo(format_examples())
+
+
 @app.command()
 def generate(
     prompt: str = typer.Argument(..., help="Natural language description of data to generate"),
@@ -118,6 +259,25 @@ def generate(
             "a path to your own compiled JSON, or 'none' for the unoptimized default."
         ),
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk prompt→code cache and always call the LLM"
+    ),
+    cache_ttl: float | None = typer.Option(
+        None, "--cache-ttl", help="Max age in seconds for cached code (default: never expires)"
+    ),
+    semantic_cache: bool = typer.Option(
+        False,
+        "--semantic-cache",
+        help="Also hit the cache for reworded prompts via local embeddings",
+    ),
+    similarity_threshold: float = typer.Option(
+        0.92,
+        "--similarity-threshold",
+        help="Minimum cosine similarity for a semantic cache hit (0.0-1.0)",
+    ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Indent per-patient JSON files (with --split); compact by default"
+    ),
 ) -> None:
     """Generate synthetic FHIR data end-to-end: prompt → LLM → code → execute → NDJSON.
 
@@ -129,71 +289,9 @@ def generate(
     - `runs/<name>/<name>.ndjson`  — NDJSON data (one patient bundle per line)
     - `runs/<name>/patient_*.json` — (with --split) per-patient JSON files
 
-    Example prompts:
-
-      # Diabetes cohort with labs
-      fhir-synth generate "10 diabetic patients with HbA1c observations"
-
-      # Cardiology patients with encounters and meds
-      fhir-synth generate "5 patients with hypertension, office encounters, and antihypertensive medications"
-
-      # Emergency department visits
-      fhir-synth generate "8 patients with ER encounters for chest pain, troponin labs, and ECG procedures"
-
-      # Oncology cohort
-      fhir-synth generate "6 lung cancer patients with staging observations, chemotherapy medication requests, and CT scan diagnostic reports"
-
-      # Pediatric immunizations
-      fhir-synth generate "10 pediatric patients aged 0-5 with immunization records for DTaP, MMR, and IPV"
-
-      # Mental health
-      fhir-synth generate "5 patients with major depressive disorder, PHQ-9 observations, and SSRI prescriptions"
-
-      # Prenatal care
-      fhir-synth generate "4 pregnant patients with prenatal encounters, ultrasound procedures, and pregnancy-related observations"
-
-      # Multi-condition elderly
-      fhir-synth generate "10 elderly patients aged 65-90 with diabetes, hypertension, CKD, encounters, labs, and medications"
-
-      # Surgical patients
-      fhir-synth generate "5 patients with appendectomy procedures, pre-op encounters, and post-op follow-up encounters"
-
-      # Allergy and immunology
-      fhir-synth generate "8 patients with allergy intolerances to penicillin and peanuts, plus related encounters"
-
-      # EMPI cross-system linkage
-      fhir-synth generate "3 patients" --empi --persons 3 --systems emr1,emr2,lab_system
-
-      # With metadata (security labels, tags, profiles)
-      fhir-synth generate "10 patients" --meta-config examples/meta-normal.yaml
-
-      # Split into per-patient files (also creates the NDJSON)
-      fhir-synth generate "20 patients with conditions" --split
-
-      # AWS Bedrock provider
-      fhir-synth generate "5 patients" --provider bedrock/us.anthropic.claude-3-5-sonnet-20241022-v2:0 --aws-profile my-profile --aws-region us-east-1
-
-      # Use Docker sandbox executor for sandboxed execution (requires Docker)
-      fhir-synth generate "5 patients" --executor docker
-
-      # E2B cloud sandbox (requires E2B_API_KEY env var)
-      fhir-synth generate "5 patients" --executor e2b
-
-      # Blaxel cloud sandbox
-      fhir-synth generate "5 patients" --executor blaxel
-
-      # Generate STU3 resources instead of R4B
-      fhir-synth generate "10 patients with diabetes" --fhir-version STU3
-
-      # Use custom skills directory
-      fhir-synth generate "5 patients" --skills-dir ~/.fhir-synth/skills
-
-      # Force keyword (zero-dependency, no embeddings) skill selection
-      fhir-synth generate "5 patients" --selector keyword
-
-      # Semantic selection (default) with a custom cosine threshold
-      fhir-synth generate "5 patients" --score-threshold 0.6
+    Run `fhir-synth examples` for a catalog of example prompts and flags.
     """
+    _install_uvloop()
     asyncio.run(
         _run_generate(
             prompt=prompt,
@@ -214,6 +312,11 @@ def generate(
             context=context,
             pipeline=pipeline,
             compiled_program=compiled_program,
+            no_cache=no_cache,
+            cache_ttl=cache_ttl,
+            semantic_cache=semantic_cache,
+            similarity_threshold=similarity_threshold,
+            pretty=pretty,
         )
     )
 
@@ -238,7 +341,16 @@ async def _run_generate(
     context: str | None,
     pipeline: str,
     compiled_program: str | None,
+    no_cache: bool = False,
+    cache_ttl: float | None = None,
+    semantic_cache: bool = False,
+    similarity_threshold: float = 0.92,
+    pretty: bool = False,
 ) -> None:
+    import orjson
+
+    from fhir_synth.reporter import TyperReporter
+
     reporter = TyperReporter()
     try:
         from fhir_synth.code_generator import CodeGenerator, get_executor
@@ -276,7 +388,7 @@ async def _run_generate(
                         for line in f:
                             if line.strip():
                                 try:
-                                    res = json.loads(line)
+                                    res = orjson.loads(line)
                                     # If it's a bundle, extract entries
                                     if res.get("resourceType") == "Bundle":
                                         for entry in res.get("entry", []):
@@ -284,10 +396,10 @@ async def _run_generate(
                                                 context_resources.append(entry["resource"])
                                     else:
                                         context_resources.append(res)
-                                except json.JSONDecodeError:
+                                except orjson.JSONDecodeError:
                                     continue
                 else:
-                    res = json.loads(context_path.read_text())
+                    res = orjson.loads(context_path.read_bytes())
                     if isinstance(res, list):
                         context_resources.extend(res)
                     elif res.get("resourceType") == "Bundle":
@@ -331,7 +443,7 @@ async def _run_generate(
         if empi:
             from fhir_synth.code_generator.prompts import build_empi_prompt
 
-            system_list = [s.strip() for s in systems.split(",") if s.strip()]
+            system_list = list(_parse_systems(systems))
             prompt_text = build_empi_prompt(
                 user_prompt=prompt_text,
                 persons=persons,
@@ -367,7 +479,7 @@ async def _run_generate(
                     executor=executor,
                     user_skill_dirs=[Path(skills_dir)] if skills_dir else None,
                 )
-            pipeline_result = two_stage.run(dspy_prompt)
+            pipeline_result = await asyncio.to_thread(two_stage.run, dspy_prompt)
             resources = pipeline_result.resources
             code = pipeline_result.code
             code_path.write_text(code)
@@ -398,13 +510,24 @@ async def _run_generate(
             else:
                 await reporter.warning("   ⚠️  No skills matched — using all available skills")
 
-            code = code_gen.generate_code_from_prompt(prompt_text)
+            # The LLM call and code execution block for seconds-to-minutes;
+            # run them in worker threads so the event loop (reporter output,
+            # signal handling) stays responsive.
+            code = await asyncio.to_thread(
+                _cached_generate_code,
+                code_gen,
+                prompt_text,
+                no_cache=no_cache,
+                cache_ttl=cache_ttl,
+                semantic=semantic_cache,
+                similarity_threshold=similarity_threshold,
+            )
             code_path.write_text(code)
             await reporter.info(f"   Saved code → {code_path}")
 
             # Step 2 — execute code (self-healing retries built-in)
             await reporter.info("▶  Executing generated code …")
-            resources = code_gen.execute_generated_code(code)
+            resources = await asyncio.to_thread(code_gen.execute_generated_code, code)
 
         # Steps 2.1–2.3 — FHIR / reference / US Core validation reports
         from fhir_synth.validation_report import report_validation_results
@@ -425,18 +548,25 @@ async def _run_generate(
             )
             await reporter.info("   Applied metadata from config")
 
-        # Step 3 — output results
-        from fhir_synth.bundle import split_resources_by_patient, write_ndjson, write_split_bundles
+        # Step 3 — output results. Bundles are streamed straight from the
+        # splitter into the writers, so no full bundle list is ever held.
+        from fhir_synth.bundle import iter_split_bundles, write_ndjson, write_split_bundles
 
-        per_patient_bundles = split_resources_by_patient(resources)
+        bundle_count = 0
+
+        def _counted() -> Any:
+            nonlocal bundle_count
+            for bundle in iter_split_bundles(resources):
+                bundle_count += 1
+                yield bundle
 
         # Always write NDJSON
-        write_ndjson(per_patient_bundles, ndjson_path)
-        await reporter.info(f"✓  {len(per_patient_bundles)} patient bundles → {ndjson_path}")
+        write_ndjson(_counted(), ndjson_path)
+        await reporter.info(f"✓  {bundle_count} patient bundles → {ndjson_path}")
 
         # --split: also write per-patient JSON files into run directory
         if split:
-            paths = write_split_bundles(per_patient_bundles, run_dir)
+            paths = write_split_bundles(iter_split_bundles(resources), run_dir, pretty=pretty)
             await reporter.info(f"✓  {len(paths)} patient files → {run_dir}/")
 
     except Exception as exc:
@@ -461,6 +591,7 @@ async def _run_generate(
 
 
 @app.command()
+@_handle_errors
 def codegen(
     prompt: str = typer.Argument(..., help="Natural language description of data"),
     out: str = typer.Option(..., "--out", "-o", help="Output file for code"),
@@ -498,64 +629,179 @@ def codegen(
         "--score-threshold",
         help="Minimum cosine similarity 0.0-1.0 (semantic only, default: 0.5)",
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk prompt→code cache and always call the LLM"
+    ),
+    cache_ttl: float | None = typer.Option(
+        None, "--cache-ttl", help="Max age in seconds for cached code (default: never expires)"
+    ),
+    semantic_cache: bool = typer.Option(
+        False,
+        "--semantic-cache",
+        help="Also hit the cache for reworded prompts via local embeddings",
+    ),
+    similarity_threshold: float = typer.Option(
+        0.92,
+        "--similarity-threshold",
+        help="Minimum cosine similarity for a semantic cache hit (0.0-1.0)",
+    ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Indent the results JSON (with --execute); compact by default"
+    ),
 ) -> None:
     """Generate Python code for resource creation from a prompt."""
-    try:
-        from fhir_synth.code_generator import CodeGenerator, get_executor
-        from fhir_synth.llm import get_provider
+    import orjson
+
+    # ── Configure skills system ────────────────────────────────
+    discovery = _configure_skills(skills_dir, selector, score_threshold)
+    builtin_n = discovery["builtin"]
+    user_n = discovery["user"]
+    total_n = discovery["total"]
+    typer.echo(f"📚 Skills: discovered {total_n} ({builtin_n} built-in, {user_n} user)")
+    if user_n:
+        user_names = [s["name"] for s in discovery["skills"] if s["source"] == "user"]
+        typer.echo(f"   User skills: {', '.join(user_names)}")
+
+    typer.echo(f"🤖 LLM: {provider}")
+
+    code_gen = _get_code_gen(
+        provider,
+        fhir_version,
+        executor_backend,
+        aws_profile=aws_profile,
+        aws_region=aws_region,
+    )
+    prompt_text = prompt
+    if empi:
+        from fhir_synth.code_generator.prompts import build_empi_prompt
 
-        # ── Configure skills system ────────────────────────────────
-        discovery = _configure_skills(skills_dir, selector, score_threshold)
-        builtin_n = discovery["builtin"]
-        user_n = discovery["user"]
-        total_n = discovery["total"]
-        typer.echo(f"📚 Skills: discovered {total_n} ({builtin_n} built-in, {user_n} user)")
-        if user_n:
-            user_names = [s["name"] for s in discovery["skills"] if s["source"] == "user"]
-            typer.echo(f"   User skills: {', '.join(user_names)}")
+        system_list = list(_parse_systems(systems))
+        prompt_text = build_empi_prompt(
+            user_prompt=prompt,
+            persons=persons,
+            systems=system_list or None,
+            include_organizations=not no_orgs,
+        )
 
-        typer.echo(f"🤖 LLM: {provider}")
+    # Show which skills were selected for this prompt
+    from fhir_synth.code_generator.prompts import get_selected_skill_names
 
-        llm = get_provider(provider, aws_profile=aws_profile, aws_region=aws_region)
-        executor = get_executor(executor_backend)
-        code_gen = CodeGenerator(llm, max_retries=2, executor=executor, fhir_version=fhir_version)
-        prompt_text = prompt
-        if empi:
-            from fhir_synth.code_generator.prompts import build_empi_prompt
+    selected_names = get_selected_skill_names(prompt_text)
+    if selected_names:
+        typer.echo(
+            f"   🎯 Selected {len(selected_names)}/{total_n} skills: {', '.join(selected_names)}"
+        )
 
-            system_list = [s.strip() for s in systems.split(",") if s.strip()]
-            prompt_text = build_empi_prompt(
-                user_prompt=prompt,
-                persons=persons,
-                systems=system_list or None,
-                include_organizations=not no_orgs,
-            )
+    code = _cached_generate_code(
+        code_gen,
+        prompt_text,
+        no_cache=no_cache,
+        cache_ttl=cache_ttl,
+        semantic=semantic_cache,
+        similarity_threshold=similarity_threshold,
+    )
 
-        # Show which skills were selected for this prompt
-        from fhir_synth.code_generator.prompts import get_selected_skill_names
+    Path(out).write_text(code)
+    typer.echo(f"✓ Generated code: {out}")
 
-        selected_names = get_selected_skill_names(prompt_text)
-        if selected_names:
-            typer.echo(
-                f"   🎯 Selected {len(selected_names)}/{total_n} skills: "
-                f"{', '.join(selected_names)}"
-            )
+    if execute:
+        typer.echo("Executing generated code...")
+        resources = code_gen.execute_generated_code(code)
+        typer.echo(f"✓ Generated {len(resources)} resources")
 
-        code = code_gen.generate_code_from_prompt(prompt_text)
+        results_file = Path(out).stem + "_results.json"
+        Path(results_file).write_bytes(
+            orjson.dumps(resources, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+        )
+        typer.echo(f"✓ Results: {results_file}")
 
-        Path(out).write_text(code)
-        typer.echo(f"✓ Generated code: {out}")
 
-        if execute:
-            typer.echo("Executing generated code...")
-            resources = code_gen.execute_generated_code(code)
-            typer.echo(f"✓ Generated {len(resources)} resources")
+@app.command("generate-batch")
+@_handle_errors
+def generate_batch(
+    prompts_file: str = typer.Argument(
+        ..., help='NDJSON file of prompts: one JSON string or {"prompt": ...} object per line'
+    ),
+    out_dir: str = typer.Option(..., "--out-dir", "-o", help="Directory for per-prompt .py files"),
+    provider: str = typer.Option("mock", "--provider", "-p", help="LLM model/provider"),
+    fhir_version: str = typer.Option(
+        "R4B", "--fhir-version", help="FHIR version: R4B, STU3 (case-insensitive)"
+    ),
+    parallel: int = typer.Option(
+        8, "--parallel", help="Max concurrent LLM requests (throughput vs. rate-limit pressure)"
+    ),
+    aws_profile: str | None = typer.Option(
+        None, "--aws-profile", help="AWS profile for Bedrock (reads ~/.aws/credentials)"
+    ),
+    aws_region: str | None = typer.Option(
+        None, "--aws-region", help="AWS region for Bedrock (e.g. us-east-1)"
+    ),
+    skills_dir: str | None = typer.Option(
+        None, "--skills-dir", help="Directory with user-provided SKILL.md skills"
+    ),
+    selector: str = typer.Option(
+        "semantic", "--selector", help="Skill selection strategy: semantic or keyword"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk prompt→code cache and always call the LLM"
+    ),
+    cache_ttl: float | None = typer.Option(
+        None, "--cache-ttl", help="Max age in seconds for cached code (default: never expires)"
+    ),
+) -> None:
+    """Generate code for many prompts concurrently, amortizing LLM round-trips.
 
-            results_file = Path(out).stem + "_results.json"
-            Path(results_file).write_text(json.dumps(resources, indent=2, default=str))
-            typer.echo(f"✓ Results: {results_file}")
-    except Exception as exc:
-        typer.echo(f"Error: {exc}", err=True)
+    Reads an NDJSON file with one prompt per line and writes
+    `<out_dir>/prompt_<n>.py` for each.  Requests are issued concurrently
+    (bounded by --parallel) so N prompts cost roughly max(latency) instead
+    of sum(latency); repeated prompts additionally hit the on-disk cache.
+    """
+    import json
+
+    prompts: list[str] = []
+    with open(prompts_file) as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            parsed = json.loads(line)
+            prompts.append(parsed["prompt"] if isinstance(parsed, dict) else str(parsed))
+    if not prompts:
+        raise ValueError(f"No prompts found in {prompts_file}")
+
+    _configure_skills(skills_dir, selector)
+    typer.echo(f"🤖 LLM: {provider}  ({len(prompts)} prompts, {parallel} parallel)")
+
+    code_gen = _get_code_gen(provider, fhir_version, aws_profile=aws_profile, aws_region=aws_region)
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    async def _run_all() -> list[str | None]:
+        semaphore = asyncio.Semaphore(parallel)
+
+        async def _one(index: int, prompt_text: str) -> str | None:
+            async with semaphore:
+                try:
+                    # Native async provider call — all in-flight requests
+                    # share the event loop instead of a thread each.
+                    code = await code_gen.generate_code_from_prompt_async(
+                        prompt_text,
+                        use_cache=not no_cache,
+                        cache_ttl=cache_ttl,
+                    )
+                except Exception as exc:  # keep the batch going on one failure
+                    typer.echo(f"   ✗ prompt {index}: {exc}", err=True)
+                    return None
+                target = out_path / f"prompt_{index}.py"
+                target.write_text(code)
+                return str(target)
+
+        return await asyncio.gather(*(_one(i, p) for i, p in enumerate(prompts, 1)))
+
+    _install_uvloop()
+    results = asyncio.run(_run_all())
+    ok = [r for r in results if r]
+    typer.echo(f"✓ Generated {len(ok)}/{len(prompts)} code files in {out_dir}")
+    if len(ok) < len(prompts):
         sys.exit(1)
 
 
@@ -687,30 +933,118 @@ def optimize(
 
 
 @app.command()
+@_handle_errors
 def bundle(
     resources: str | None = typer.Option(None, "--resources", "-r", help="Input NDJSON file"),
     out: str = typer.Option(..., "--out", "-o", help="Output Bundle JSON file"),
-    bundle_type: str = typer.Option("transaction", "--type", help="Bundle type"),
+    bundle_type: Annotated[
+        BundleType, typer.Option("--type", help="Bundle type")
+    ] = BundleType.transaction,
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Indent the output JSON (buffers the whole bundle in memory)"
+    ),
 ) -> None:
-    """Create a FHIR Bundle from NDJSON resources."""
+    """Create a FHIR Bundle from NDJSON resources.
+
+    The input is memory-mapped and parsed chunk-by-chunk, and the bundle
+    is streamed to disk entry-by-entry, so peak memory stays at O(one
+    chunk) regardless of input size — multi-hundred-MB NDJSON files no
+    longer materialize a full in-memory bundle plus its JSON string.
+    Parsing is sequential: `orjson.loads` holds the GIL, so threading it
+    only adds dispatch overhead.
+    """
+    import mmap
+    from collections.abc import Iterator
+    from itertools import islice
+
+    import orjson
+
     from fhir_synth.bundle import BundleBuilder
 
-    try:
-        if not resources:
-            raise ValueError("--resources is required")
-
-        builder = BundleBuilder(bundle_type=bundle_type)
-        with open(resources) as handle:
-            for line in handle:
-                if line.strip():
-                    builder.add_resource(json.loads(line))
-
-        _bundle = builder.build()
-        Path(out).write_text(json.dumps(_bundle, indent=2, default=str))
-        typer.echo(f"✓ Created bundle with {_bundle['total']} entries: {out}")
-    except Exception as exc:
-        typer.echo(f"Error: {exc}", err=True)
-        sys.exit(1)
+    if not resources:
+        raise ValueError("--resources is required")
+
+    builder = BundleBuilder(bundle_type=bundle_type.value)
+    total = 0
+    chunk_lines = 10_000
+
+    def _line_chunks(handle: Any) -> Iterator[list[Any]]:
+        """Yield chunks of NDJSON lines, zero-copy where possible.
+
+        Memory-maps the file and yields `memoryview` slices split on
+        newlines — no per-line `bytes` allocation and no read-ahead
+        buffering.  Falls back to the buffered line iterator for
+        inputs that can't be mapped (pipes, empty files).
+        """
+        try:
+            mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            while chunk := [line for line in islice(handle, chunk_lines) if line.strip()]:
+                yield chunk
+            return
+        view = memoryview(mm)
+        ws = b" \t\r\x0b\x0c"  # line-internal whitespace (never contains \n)
+        slices: list[Any] = []
+        try:
+            start = 0
+            size = len(mm)
+            while (end := mm.find(b"\n", start)) != -1:
+                # Skip leading whitespace — one byte test on normal lines —
+                # so blank/whitespace-only lines are dropped like the
+                # buffered path's `line.strip()` filter.
+                pos = start
+                while pos < end and mm[pos] in ws:
+                    pos += 1
+                if pos < end:
+                    slices.append(view[pos:end])
+                    if len(slices) == chunk_lines:
+                        yield slices
+                        for mv in slices:
+                            mv.release()
+                        slices = []
+                start = end + 1
+            pos = start
+            while pos < size and mm[pos] in ws:
+                pos += 1
+            if pos < size:
+                slices.append(view[pos:size])
+            if slices:
+                yield slices
+        finally:
+            # Release any slices still outstanding (including after an
+            # error mid-chunk) — mm.close() raises BufferError otherwise.
+            for mv in slices:
+                mv.release()
+            view.release()
+            mm.close()
+
+    with (
+        open(resources, "rb") as handle,
+        open(out, "wb", buffering=1 << 20) as sink,
+    ):
+        if not pretty:
+            header = builder.build()  # entries are empty — envelope fields only
+            del header["entry"], header["total"]
+            envelope = orjson.dumps(header)
+            # Re-open the envelope's closing brace and splice in the entries
+            sink.write(envelope[:-1] + b',"entry":[')
+        for chunk in _line_chunks(handle):
+            # Only one chunk is resident at a time; entries are emitted
+            # as they are parsed.
+            for resource in map(orjson.loads, chunk):
+                builder.add_resource(resource)
+                if not pretty:
+                    if total:
+                        sink.write(b",")
+                    sink.write(orjson.dumps(builder.entries.pop(), default=str))
+                total += 1
+        if pretty:
+            # Readability path — materializes the whole bundle.
+            sink.write(orjson.dumps(builder.build(), default=str, option=orjson.OPT_INDENT_2))
+        else:
+            sink.write(b'],"total":%d}' % total)
+
+    typer.echo(f"✓ Created bundle with {total} entries: {out}")
 
 
 if __name__ == "__main__":
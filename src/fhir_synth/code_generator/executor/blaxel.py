@@ -9,10 +9,11 @@ Requires the `blaxel-core` package::
     pip install "fhir-synth[blaxel]"
 """
 
-import json
 import logging
 from typing import Any
 
+import orjson
+
 from fhir_synth.code_generator.executor.base import (
     ExecutionResult,
     get_execution_packages,
@@ -76,7 +77,7 @@ class BlaxelExecutor:
         if not stdout_text:
             raise RuntimeError("Blaxel sandbox produced no output")
 
-        data = json.loads(stdout_text)
+        data = orjson.loads(stdout_text)
         if isinstance(data, dict) and "__error__" in data:
             raise ValueError(data["__error__"])
 
@@ -16,11 +16,12 @@ Requires the `docker` Python package::
 A local Docker daemon must be running (`docker info` should succeed).
 """
 
-import json
 import logging
 import socket
 from typing import Any
 
+import orjson
+
 from fhir_synth.code_generator.executor.base import (
     ExecutionResult,
     get_execution_packages,
@@ -122,7 +123,7 @@ class DockerSandboxExecutor:
         if not stdout_text:
             raise RuntimeError("Docker sandbox produced no output")
 
-        data = json.loads(stdout_text)
+        data = orjson.loads(stdout_text)
         if isinstance(data, dict) and "__error__" in data:
             raise ValueError(data["__error__"])
 
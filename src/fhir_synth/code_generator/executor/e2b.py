@@ -10,11 +10,12 @@ Requires the `e2b-code-interpreter` package and an `E2B_API_KEY`::
     export E2B_API_KEY=e2b_...
 """
 
-import json
 import logging
 import os
 from typing import Any
 
+import orjson
+
 from fhir_synth.code_generator.executor.base import (
     ExecutionResult,
     get_execution_packages,
@@ -80,7 +81,7 @@ class E2BExecutor:
         if not stdout_text:
             raise RuntimeError("E2B sandbox produced no output")
 
-        data = json.loads(stdout_text)
+        data = orjson.loads(stdout_text)
         if isinstance(data, dict) and "__error__" in data:
             raise ValueError(data["__error__"])
 
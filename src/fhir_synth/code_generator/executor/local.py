@@ -6,10 +6,10 @@ which interprets code at the AST level with fine-grained import control
 and a restricted set of built-in functions.
 """
 
-import json
 import logging
 from typing import Any
 
+import orjson
 from smolagents.local_python_executor import (
     BASE_BUILTIN_MODULES,
     BASE_PYTHON_TOOLS,
@@ -134,7 +134,7 @@ class LocalSmolagentsExecutor:
         if isinstance(output, list):
             data = output
         elif isinstance(output, str):
-            data = json.loads(output)
+            data = orjson.loads(output)
         else:
             raise RuntimeError(
                 f"Expected list from generate_resources(), got {type(output).__name__}"
@@ -145,8 +145,11 @@ class LocalSmolagentsExecutor:
                 f"Expected list from generate_resources(), got {type(data).__name__}"
             )
 
+        # No stdout round-trip for the local backend — artifacts are the
+        # payload, and re-serializing every resource into an unread field
+        # costs time proportional to output size.
         return ExecutionResult(
-            stdout=json.dumps(data, default=str),
+            stdout="",
             stderr="",
             artifacts=data,
         )
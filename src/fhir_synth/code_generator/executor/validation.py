@@ -1,7 +1,8 @@
 """Shared validation helpers for code execution.
 
-FHIR-specific validation and auto-fix utilities.  Security enforcement
-(import whitelisting, dangerous builtin blocking) is handled by smolagents.
+FHIR-specific validation and auto-fix utilities.  Imports are checked
+against the sandbox allowlist here (fail fast, before execution); full
+security enforcement (dangerous builtin blocking) stays with smolagents.
 """
 
 import ast
@@ -9,7 +10,9 @@ import importlib.util
 import logging
 import re
 import textwrap
+from functools import lru_cache
 
+from fhir_synth.code_generator.constants import ALLOWED_MODULE_PREFIXES, ALLOWED_MODULES
 from fhir_synth.fhir_spec import class_to_module
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,20 @@ logger = logging.getLogger(__name__)
 # ── Code validation (syntax only) ─────────────────────────────────────────
 
 
+@lru_cache(maxsize=64)
+def _parse_cached(code: str) -> ast.Module | None:
+    """Parse *code*, returning None on syntax errors.
+
+    Cached by source text — the retry loop and the prompt cache both
+    revisit identical code, and parsing is the dominant per-visit cost.
+    Callers must treat the returned tree as read-only.
+    """
+    try:
+        return ast.parse(code)
+    except SyntaxError:
+        return None
+
+
 def validate_code(code: str) -> bool:
     """Validate that generated code is syntactically correct.
 
@@ -27,33 +44,69 @@ def validate_code(code: str) -> bool:
     Returns:
         True if valid Python syntax, False otherwise.
     """
-    try:
-        ast.parse(code)
-    except SyntaxError:
-        return False
-    return True
+    return _parse_cached(code) is not None
 
 
 # ── Import correctness (fhir.resources modules exist?) ─────────────────────
 
 
+def _is_allowed_module(module: str) -> bool:
+    """Whether *module* passes the sandbox import allowlist."""
+    root = module.split(".", 1)[0]
+    if root in ALLOWED_MODULES:
+        return True
+    return any(
+        module == prefix or module.startswith(f"{prefix}.") for prefix in ALLOWED_MODULE_PREFIXES
+    )
+
+
+# Builtins smolagents' interpreter refuses to call (its DANGEROUS_FUNCTIONS)
+_BLOCKED_CALLS = frozenset({"compile", "eval", "exec", "globals", "locals", "__import__"})
+
+
 def validate_imports(code: str) -> list[str]:
-    """Validate that `fhir.resources` imports reference real modules.
+    """Validate imports and blocked builtins in one cached AST walk.
+
+    smolagents enforces the same rules at execution time, but checking here
+    rejects disallowed imports and calls to blocked builtins (`eval`,
+    `exec`, ...) before an executor round-trip is spent on them. All checks
+    share a single cached AST walk; working from the AST also avoids false
+    positives on names that merely appear in strings or comments.
+
+    Results are memoized by source text (the retry loop revalidates
+    identical code), with a fresh list returned per call.
 
     Returns:
-        List of error messages, empty if all imports are valid.
+        List of error messages, empty if the code passes.
     """
+    return list(_validate_imports_cached(code))
+
+
+@lru_cache(maxsize=256)
+def _validate_imports_cached(code: str) -> tuple[str, ...]:
+    """Walk + `find_spec` results for `validate_imports`, keyed by source."""
     errors: list[str] = []
 
-    try:
-        tree = ast.parse(code)
-    except SyntaxError:
-        return ["Syntax error in code"]
+    tree = _parse_cached(code)
+    if tree is None:
+        return ("Syntax error in code",)
 
     for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom):
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id in _BLOCKED_CALLS:
+                errors.append(f"Call not allowed in sandbox: {func.id}() — remove it")
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if not _is_allowed_module(alias.name):
+                    errors.append(f"Import not allowed in sandbox: {alias.name}")
+        elif isinstance(node, ast.ImportFrom):
             module = node.module
-            if module and module.startswith("fhir.resources"):
+            if module is None or node.level:
+                continue
+            if not _is_allowed_module(module):
+                errors.append(f"Import not allowed in sandbox: {module}")
+            elif module.startswith("fhir.resources"):
                 spec = importlib.util.find_spec(module)
                 if spec is None:
                     errors.append(f"Invalid import: {module} (module not found)")
@@ -65,7 +118,7 @@ def validate_imports(code: str) -> list[str]:
                                 errors.append(
                                     f"  → Fix: from fhir.resources.R4B.{correct_mod} import {alias.name}"
                                 )
-    return errors
+    return tuple(errors)
 
 
 # ── Auto-fix common import mistakes ───────────────────────────────────────
@@ -87,6 +140,7 @@ def strip_future_imports(code: str) -> str:
     return "".join(line for line in lines if not line.lstrip().startswith("from __future__"))
 
 
+@lru_cache(maxsize=256)
 def fix_common_imports(code: str) -> str:
     """Auto-fix import mistakes using the introspected class→module map.
 
@@ -94,6 +148,10 @@ def fix_common_imports(code: str) -> str:
     correct module for each class.  Also strips ``from __future__`` imports
     which smolagents does not allow.
 
+    Memoized by source text — the retry loop revisits identical code, and
+    the regex pass plus per-class lookups are pure. `set_fhir_version`
+    clears the cache along with the other introspection caches.
+
     Returns:
         Fixed code.
     """
@@ -113,6 +171,11 @@ def fix_common_imports(code: str) -> str:
                 correct_mod = current_mod
             mod_to_classes.setdefault(correct_mod, []).append(cls_name)
 
+        # Fast path: every class already lives in the stated module — keep
+        # the original line instead of rebuilding an identical one.
+        if set(mod_to_classes) == {current_mod}:
+            return match.group(0)
+
         lines: list[str] = []
         for mod, classes in sorted(mod_to_classes.items()):
             lines.append(f"{prefix}{mod}{import_kw}{', '.join(classes)}")
@@ -121,18 +184,74 @@ def fix_common_imports(code: str) -> str:
     return strip_future_imports(_IMPORT_RE.sub(_fix_line, code))
 
 
+# ── Deterministic quick fixes (avoid an LLM round-trip) ────────────────────
+
+# Stray Markdown fence lines that survived extraction
+_FENCE_LINE_RE = re.compile(r"^\s*```[a-zA-Z]*\s*$\n?", re.MULTILINE)
+
+# "name 'X' is not defined" from NameError / smolagents InterpreterError
+_UNDEFINED_NAME_RE = re.compile(r"name '(\w+)' is not defined")
+
+# Names LLMs routinely use without importing, with the canonical import
+_COMMON_IMPORTS: dict[str, str] = {
+    "Decimal": "from decimal import Decimal",
+    "date": "from datetime import date",
+    "datetime": "from datetime import datetime",
+    "timedelta": "from datetime import timedelta",
+    "timezone": "from datetime import timezone",
+    "uuid4": "from uuid import uuid4",
+    "random": "import random",
+    "math": "import math",
+    "json": "import json",
+}
+
+
+def quick_fix(code: str, error: str) -> str | None:
+    """Deterministic repairs for common LLM failure modes.
+
+    Each LLM fix round-trip costs seconds; stray Markdown fences and a
+    forgotten stdlib import don't need one. Returns repaired code when a
+    local fix applies and the result parses, else None — callers fall
+    back to the LLM.
+
+    Args:
+        code: The code that failed.
+        error: The error message it failed with.
+    """
+    if "SyntaxError" in error or "not valid Python" in error:
+        fixed = _FENCE_LINE_RE.sub("", code)
+        if fixed != code and validate_code(fixed):
+            return fixed
+        return None
+
+    match = _UNDEFINED_NAME_RE.search(error)
+    if match:
+        stmt = _COMMON_IMPORTS.get(match.group(1))
+        if stmt and stmt not in code:
+            return f"{stmt}\n{code}"
+    return None
+
+
 # ── Shared runner script ───────────────────────────────────────────────────
 
+# Static body dedented once at import time; build_runner_script only
+# splices the user code in place of the sentinel, so no str.format pass
+# (and no doubled-brace escaping) runs per call.
 _RUNNER_TEMPLATE = textwrap.dedent("""\
     import json as _json
     import sys as _sys
 
-    _user_code = {user_code_repr}
-    _glb = {{}}
+    try:
+        import orjson as _orjson
+    except ImportError:
+        _orjson = None
+
+    _user_code = __USER_CODE__
+    _glb = {}
     exec(compile(_user_code, "<generated>", "exec"), _glb)
 
     if "generate_resources" not in _glb:
-        print(_json.dumps({{"__error__": "Code must define generate_resources()"}}))
+        print(_json.dumps({"__error__": "Code must define generate_resources()"}))
         _sys.exit(1)
 
     _result = _glb["generate_resources"]()
@@ -140,18 +259,21 @@ _RUNNER_TEMPLATE = textwrap.dedent("""\
         _result = [_result]
 
     if not _result:
-        print(_json.dumps({{"__error__": "generate_resources() returned empty list — it must return at least one resource dict"}}))
+        print(_json.dumps({"__error__": "generate_resources() returned empty list — it must return at least one resource dict"}))
         _sys.exit(1)
 
     for _i, _r in enumerate(_result[:5]):
         if not isinstance(_r, dict):
-            print(_json.dumps({{"__error__": f"Resource {{_i}} is {{type(_r).__name__}}, expected dict — use .model_dump(exclude_none=True) on Pydantic models"}}))
+            print(_json.dumps({"__error__": f"Resource {_i} is {type(_r).__name__}, expected dict — use .model_dump(exclude_none=True) on Pydantic models"}))
             _sys.exit(1)
         if "resourceType" not in _r:
-            print(_json.dumps({{"__error__": f"Resource {{_i}} is missing 'resourceType' (keys: {{list(_r.keys())[:5]}}) — use .model_dump(exclude_none=True) on Pydantic models"}}))
+            print(_json.dumps({"__error__": f"Resource {_i} is missing 'resourceType' (keys: {list(_r.keys())[:5]}) — use .model_dump(exclude_none=True) on Pydantic models"}))
             _sys.exit(1)
 
-    print(_json.dumps(_result, default=str))
+    if _orjson is not None:
+        print(_orjson.dumps(_result, default=str).decode())
+    else:
+        print(_json.dumps(_result, default=str))
 """)
 
 
@@ -169,4 +291,4 @@ def build_runner_script(code: str) -> str:
     Args:
         code: The user-generated Python source code.
     """
-    return _RUNNER_TEMPLATE.format(user_code_repr=repr(code))
+    return _RUNNER_TEMPLATE.replace("__USER_CODE__", repr(code))
@@ -1,5 +1,6 @@
 """Main code generation engine."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -7,6 +8,7 @@ from fhir_synth.code_generator.executor import (
     Executor,
     LocalSmolagentsExecutor,
     fix_common_imports,
+    quick_fix,
     validate_code,
     validate_imports,
 )
@@ -58,19 +60,146 @@ class CodeGenerator:
 
         fhir_spec.set_fhir_version(fhir_version)
 
-    def generate_code_from_prompt(self, prompt: str) -> str:
+    def generate_code_from_prompt(
+        self,
+        prompt: str,
+        *,
+        use_cache: bool = True,
+        cache_ttl: float | None = None,
+    ) -> str:
         """Generate Python code from natural language prompt.
 
+        Prompts matching a known structural shape are filled from a local
+        template (see :mod:`fhir_synth.program_cache`) without calling the
+        LLM at all. The structural tier (:mod:`fhir_synth.gen_cache`) is
+        keyed on model and FHIR version. The exact tier
+        (:mod:`fhir_synth.llm_cache`) is keyed on the model, the full
+        system prompt, and the built user prompt — editing a template or a
+        skill invalidates that tier only. Both are skipped when the
+        provider is configured with a nonzero sampling temperature, since
+        outputs are then not reproducible.
+
         Args:
             prompt: Natural language description of resources to generate
+            use_cache: Consult/populate the on-disk cache (default True)
+            cache_ttl: Maximum cache-entry age in seconds (None = no expiry)
 
         Returns:
             Generated Python code as string
         """
+        if use_cache and not self.context_resources:
+            from fhir_synth import gen_cache, program_cache
+
+            template_code = program_cache.lookup(prompt, self.fhir_version)
+            if template_code is not None:
+                logger.info("Prompt matched a known template — skipping LLM call")
+                return template_code
+
+            structural = gen_cache.lookup(
+                prompt, self.llm.model, self.fhir_version, cache_ttl=cache_ttl
+            )
+            if structural is not None:
+                return structural
+
+        user_prompt = build_code_prompt(prompt, context_resources=self.context_resources)
+        system_prompt = get_system_prompt(user_prompt=prompt)
+
+        temperature = getattr(self.llm, "extra_kwargs", {}).get("temperature")
+        if not use_cache or (temperature is not None and temperature != 0):
+            return extract_code(self.llm.generate_text(user_prompt, system=system_prompt))
+
+        from fhir_synth import llm_cache
+
+        key = llm_cache.cache_key(self.llm.model, f"{system_prompt}\x00{user_prompt}")
+        raw = llm_cache.get(key, suffix=".py", ttl=cache_ttl)
+        if raw is None:
+            raw = self.llm.generate_text(user_prompt, system=system_prompt)
+            llm_cache.set(key, raw, suffix=".py")
+            if not self.context_resources:
+                gen_cache.store(prompt, self.llm.model, self.fhir_version, extract_code(raw))
+        return extract_code(raw)
+
+    async def generate_code_from_prompt_async(
+        self,
+        prompt: str,
+        *,
+        use_cache: bool = True,
+        cache_ttl: float | None = None,
+    ) -> str:
+        """Async counterpart of :meth:`generate_code_from_prompt`.
+
+        Awaits the provider's `litellm.acompletion`-backed call, so many
+        prompts (e.g. `generate-batch`) can be in flight on one event loop
+        without a thread per request. Template fast path and on-disk cache
+        behave identically to the sync method.
+        """
+        if use_cache and not self.context_resources:
+            from fhir_synth import gen_cache, program_cache
+
+            template_code = program_cache.lookup(prompt, self.fhir_version)
+            if template_code is not None:
+                logger.info("Prompt matched a known template — skipping LLM call")
+                return template_code
+
+            structural = gen_cache.lookup(
+                prompt, self.llm.model, self.fhir_version, cache_ttl=cache_ttl
+            )
+            if structural is not None:
+                return structural
+
         user_prompt = build_code_prompt(prompt, context_resources=self.context_resources)
         system_prompt = get_system_prompt(user_prompt=prompt)
-        code = self.llm.generate_text(system_prompt, user_prompt)
-        return extract_code(code)
+
+        temperature = getattr(self.llm, "extra_kwargs", {}).get("temperature")
+        if not use_cache or (temperature is not None and temperature != 0):
+            return extract_code(
+                await self.llm.generate_text_async(user_prompt, system=system_prompt)
+            )
+
+        from fhir_synth import llm_cache
+
+        key = llm_cache.cache_key(self.llm.model, f"{system_prompt}\x00{user_prompt}")
+        raw = llm_cache.get(key, suffix=".py", ttl=cache_ttl)
+        if raw is None:
+            raw = await self.llm.generate_text_async(user_prompt, system=system_prompt)
+            llm_cache.set(key, raw, suffix=".py")
+            if not self.context_resources:
+                gen_cache.store(prompt, self.llm.model, self.fhir_version, extract_code(raw))
+        return extract_code(raw)
+
+    async def generate_code_from_prompt_batch(
+        self,
+        prompts: list[str],
+        *,
+        concurrency: int = 16,
+        use_cache: bool = True,
+        cache_ttl: float | None = None,
+    ) -> list[str]:
+        """Generate code for many prompts concurrently.
+
+        Each prompt goes through the same cache tiers and async provider
+        call as :meth:`generate_code_from_prompt_async`; a semaphore caps
+        in-flight LLM requests so a large batch finishes in roughly the
+        latency of its slowest call without flooding the endpoint.
+
+        Args:
+            prompts: Prompts to generate code for, order preserved.
+            concurrency: Maximum simultaneous LLM requests.
+            use_cache: Whether to consult/populate the caches.
+            cache_ttl: Maximum cache-entry age in seconds (None = no expiry).
+
+        Returns:
+            Generated code per prompt, in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_code_from_prompt_async(
+                    prompt, use_cache=use_cache, cache_ttl=cache_ttl
+                )
+
+        return list(await asyncio.gather(*(_one(p) for p in prompts)))
 
     def execute_generated_code(self, code: str, timeout: int = 30) -> list[dict[str, Any]]:
         """Execute generated code safely, with self-healing retry on failure.
@@ -105,7 +234,12 @@ class CodeGenerator:
         for attempt in range(1 + self.max_retries):
             if not validate_code(code):
                 last_error = ValueError("Generated code is not valid Python")
-                code = self._retry_with_error(code, str(last_error))
+                fixed = quick_fix(code, str(last_error))
+                if fixed is not None:
+                    logger.info("Quick-fixed syntax error locally — no LLM retry needed")
+                    code = fixed
+                else:
+                    code = self._retry_with_error(code, str(last_error))
                 continue
 
             try:
@@ -184,7 +318,14 @@ class CodeGenerator:
             except Exception as exc:
                 last_error = exc
                 if attempt < self.max_retries:
-                    code = self._retry_with_error(code, str(exc))
+                    fixed = quick_fix(code, str(exc))
+                    if fixed is not None:
+                        logger.info(
+                            "Quick-fixed %s locally — no LLM retry needed", type(exc).__name__
+                        )
+                        code = fixed
+                    else:
+                        code = self._retry_with_error(code, str(exc))
 
         # If we got here, all retries failed
         # Build helpful error message
@@ -211,7 +352,7 @@ class CodeGenerator:
         """
         fix_prompt = build_fix_prompt(code, error)
         system_prompt = get_system_prompt()
-        fixed = self.llm.generate_text(system_prompt, fix_prompt)
+        fixed = self.llm.generate_text(fix_prompt, system=system_prompt)
         return extract_code(fixed)
 
     @staticmethod
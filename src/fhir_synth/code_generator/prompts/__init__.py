@@ -17,6 +17,7 @@ This module re-exports the **same public API** that `generator.py` consumes:
 import logging
 import warnings
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -59,6 +60,36 @@ class _SkillState:
 _state = _SkillState()
 
 
+@lru_cache(maxsize=4)
+def _system_section(fhir_version: str) -> str:
+    """Rendered `system/` section for *fhir_version*.
+
+    The section only varies by FHIR version (the sandbox placeholders are
+    module constants), so the render — several file reads plus template
+    substitution — runs once per version instead of on every prompt,
+    including each retry of the fix loop.
+    """
+    system_raw = load_section("system")
+    return render(
+        system_raw,
+        allowed_list=_ALLOWED_LIST,
+        allowed_prefixes=_ALLOWED_PREFIXES,
+        fhir_version=fhir_version,
+    )
+
+
+@lru_cache(maxsize=4)
+def _example_imports(fhir_version: str) -> str:
+    """Example import block for *fhir_version*, built once per version."""
+    return f"""from fhir.resources.{fhir_version}.patient import Patient
+from fhir.resources.{fhir_version}.encounter import Encounter
+from fhir.resources.{fhir_version}.condition import Condition
+from fhir.resources.{fhir_version}.codeableconcept import CodeableConcept
+from fhir.resources.{fhir_version}.coding import Coding
+from fhir.resources.{fhir_version}.reference import Reference
+from fhir.resources.{fhir_version}.period import Period"""
+
+
 def configure_skills(
     user_dirs: list[Path] | None = None,
     selector: SkillSelector | None = None,
@@ -106,14 +137,7 @@ def _build_system_prompt(
     if fhir_version is None:
         fhir_version = get_fhir_version()
 
-    # Load the system section (has $allowed_list / $allowed_prefixes in sandbox.md)
-    system_raw = load_section("system")
-    system_text = render(
-        system_raw,
-        allowed_list=_ALLOWED_LIST,
-        allowed_prefixes=_ALLOWED_PREFIXES,
-        fhir_version=fhir_version,
-    )
+    system_text = _system_section(fhir_version)
 
     # ── Skills-based clinical knowledge (selective loading) ─────────
     loader = _state.get_loader()
@@ -235,22 +259,13 @@ def build_code_prompt(
         context_json = json.dumps(subset, indent=2)
         context_text = f"\nEXISTING RESOURCES (STATE CONTEXT):\n{context_json}\n"
 
-    # Build example imports dynamically based on the FHIR version
-    example_imports = f"""from fhir.resources.{fhir_version}.patient import Patient
-from fhir.resources.{fhir_version}.encounter import Encounter
-from fhir.resources.{fhir_version}.condition import Condition
-from fhir.resources.{fhir_version}.codeableconcept import CodeableConcept
-from fhir.resources.{fhir_version}.coding import Coding
-from fhir.resources.{fhir_version}.reference import Reference
-from fhir.resources.{fhir_version}.period import Period"""
-
     return render(
         template,
         requirement=requirement,
         fhir_version=fhir_version,
         fhir_imports=import_guide(),
         fhir_spec=spec_summary(),
-        example_imports=example_imports,
+        example_imports=_example_imports(fhir_version),
         context_resources=context_text,
     )
 
@@ -277,6 +292,12 @@ def build_fix_prompt(code: str, error: str) -> str:
     )
 
 
+_ORGS_HINT_YES = (
+    "Create Organization resources for each system and link Patients via managingOrganization."
+)
+_ORGS_HINT_NO = "Do not create Organization resources."
+
+
 def build_empi_prompt(
     user_prompt: str,
     persons: int,
@@ -296,13 +317,15 @@ def build_empi_prompt(
 
     Returns:
         Augmented prompt with EMPI instructions
+
+    Note:
+        The template keeps all invariant instruction text first and the
+        varying fields (persons, systems, orgs hint, user prompt) last,
+        and systems are sorted — so repeated calls share the longest
+        possible byte-identical prefix for provider-side prompt caching.
     """
-    systems = systems or ["emr1", "emr2"]
-    orgs_hint = (
-        "Create Organization resources for each system and link Patients via managingOrganization."
-        if include_organizations
-        else "Do not create Organization resources."
-    )
+    systems = sorted(systems) if systems else ["emr1", "emr2"]
+    orgs_hint = _ORGS_HINT_YES if include_organizations else _ORGS_HINT_NO
     template = load_prompt("templates/empi_prompt.md")
     return render(
         template,
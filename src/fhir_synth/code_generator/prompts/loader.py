@@ -6,7 +6,7 @@ editable installations without any build configuration.
 
 import importlib.resources
 import logging
-from functools import lru_cache
+from functools import cache, lru_cache
 from string import Template
 
 logger = logging.getLogger(__name__)
@@ -15,9 +15,13 @@ logger = logging.getLogger(__name__)
 _PACKAGE = "fhir_synth.code_generator.prompts"
 
 
+@cache
 def _read(subpath: str) -> str:
     """Read a single file from the prompts package.
 
+    Cached — templates ship inside the package and never change at
+    runtime, so each file is read from disk once per process.
+
     Args:
         subpath: Relative path within the prompts package,
             e.g. `"system/01_role.md"`
@@ -70,10 +74,18 @@ def load_section(subdir: str) -> str:
     return _load_dir(subdir)
 
 
+@cache
+def _compiled_template(template_text: str) -> Template:
+    """Compile (once per distinct text) a `string.Template`."""
+    return Template(template_text)
+
+
 def render(template_text: str, **kwargs: str) -> str:
     """Render a `string.Template` with safe substitution.
 
-    Unknown `$placeholders` are left as-is rather than raising.
+    Unknown `$placeholders` are left as-is rather than raising. The
+    Template object (and its placeholder parse) is cached per distinct
+    template text, so repeated renders only pay for substitution.
 
     Args:
         template_text: Raw template with `$variable` placeholders.
@@ -82,4 +94,4 @@ def render(template_text: str, **kwargs: str) -> str:
     Returns:
         Rendered string.
     """
-    return Template(template_text).safe_substitute(kwargs)
+    return _compiled_template(template_text).safe_substitute(kwargs)
@@ -1,10 +1,18 @@
 """Utilities for code extraction and manipulation."""
 
+import re
+
+# First fenced block, with or without a python language tag. Compiled once —
+# this runs on every LLM response including each fix-loop retry.
+_CODE_FENCE_RE = re.compile(r"```(?:python|py)?[ \t]*\r?\n(.*?)```", re.DOTALL)
+
 
 def extract_code(response: str) -> str:
     """Extract Python code from LLM response.
 
-    Handles Markdown code blocks and plain text responses.
+    Handles Markdown code blocks and plain text responses with a single
+    regex pass instead of chained `str.find` calls and a first-line
+    language-tag heuristic.
 
     Args:
         response: LLM response text
@@ -12,22 +20,7 @@ def extract_code(response: str) -> str:
     Returns:
         Extracted Python code
     """
-    # Try to extract from the Markdown code block
-    if "``python" in response:
-        start = response.find("``python") + 9
-        end = response.find("``", start)
-        if end > start:
-            return response[start:end].strip()
-
-    if "``" in response:
-        start = response.find("``") + 3
-        end = response.find("``", start)
-        if end > start:
-            code = response[start:end].strip()
-            # Remove language specifier if present
-            lines = code.split("\n")
-            if lines[0] and not lines[0].startswith("def ") and not lines[0].startswith("import"):
-                code = "\n".join(lines[1:])
-            return code
-
+    match = _CODE_FENCE_RE.search(response)
+    if match:
+        return match.group(1).strip()
     return response.strip()
@@ -46,19 +46,14 @@ def set_fhir_version(version: str) -> None:
     """Set the FHIR version to use (R4B, STU3, etc.).
 
     Must be called before any other functions in this module if you want
-    to use a non-default version. This clears all cached data and re-discovers
-    resources for the new version.
+    to use a non-default version. Switching to a different version clears
+    all cached data and re-discovers resources lazily; re-asserting the
+    already-active version is a cheap no-op.
 
     Args:
         version: FHIR version string (case-insensitive). Supported: R4B, STU3
     """
-    global \
-        _FHIR_VERSION, \
-        _MODULE_MAP, \
-        _DATA_TYPE_MAP, \
-        _CLASS_MODULE_MAP, \
-        _MODULE_CLASSES, \
-        CLINICAL_RESOURCES
+    global _FHIR_VERSION, _DISCOVERY, _CLINICAL_RESOURCES
 
     # Normalize version to uppercase
     version_upper = version.upper()
@@ -77,14 +72,28 @@ def set_fhir_version(version: str) -> None:
             f"Unsupported FHIR version: {version!r}. Supported: {supported} (case-insensitive)"
         )
 
+    if canonical_version == _FHIR_VERSION:
+        return  # already active — keep the warm caches
+
     _FHIR_VERSION = canonical_version
-    # Clear all caches when version changes
+    # Clear all caches when version changes; discovery re-runs lazily
     get_resource_class.cache_clear()
     _introspect.cache_clear()
     _get_base_classes.cache_clear()
-    # Re-discover all resources for the new version
-    _MODULE_MAP, _DATA_TYPE_MAP, _CLASS_MODULE_MAP, _MODULE_CLASSES = _discover_all()
-    CLINICAL_RESOURCES = _discover_clinical_resources()
+    _DISCOVERY = None
+    _CLINICAL_RESOURCES = None
+
+    # Downstream memoized results built on the discovery maps (lazy
+    # imports: both modules depend on this one)
+    from fhir_synth.bundle.builder import _build_patient_ref_index
+    from fhir_synth.code_generator.executor.validation import (
+        _validate_imports_cached,
+        fix_common_imports,
+    )
+
+    fix_common_imports.cache_clear()
+    _validate_imports_cached.cache_clear()
+    _build_patient_ref_index.cache_clear()
 
 
 def get_fhir_version() -> str:
@@ -222,13 +231,29 @@ def _discover_all() -> tuple[dict[str, str], dict[str, str], dict[str, str], dic
     return resource_map, data_type_map, class_module_map, module_classes
 
 
-# Built once at import time
-_MODULE_MAP, _DATA_TYPE_MAP, _CLASS_MODULE_MAP, _MODULE_CLASSES = _discover_all()
+# Discovered lazily on first access — importing this module stays cheap.
+# The full scan imports every fhir.resources module (~2 s cold), which
+# `--help` and argv-error paths should never pay for.
+_DISCOVERY: tuple[dict[str, str], dict[str, str], dict[str, str], dict[str, list[str]]] | None = (
+    None
+)
+
+
+def _maps() -> tuple[dict[str, str], dict[str, str], dict[str, str], dict[str, list[str]]]:
+    """Return (resource_map, data_type_map, class_module_map, module_classes).
+
+    Runs `_discover_all` on first call (and again after
+    `set_fhir_version`, which resets the cache).
+    """
+    global _DISCOVERY
+    if _DISCOVERY is None:
+        _DISCOVERY = _discover_all()
+    return _DISCOVERY
 
 
 def class_to_module(class_name: str) -> str | None:
     """Return the module name for a Pydantic class, or None if unknown."""
-    return _CLASS_MODULE_MAP.get(class_name)
+    return _maps()[2].get(class_name)
 
 
 # ── Lazy loaders (import + introspect on first access, then cached) ───────
@@ -243,10 +268,11 @@ def get_resource_class(name: str) -> type[BaseModel]:
     Raises:
         ValueError: If *name* is not a known resource type.
     """
-    modname = _MODULE_MAP.get(name)
+    resource_map = _maps()[0]
+    modname = resource_map.get(name)
     if modname is None:
         raise ValueError(
-            f"Unknown FHIR resource type: {name!r}. Known: {', '.join(sorted(_MODULE_MAP)[:20])} …"
+            f"Unknown FHIR resource type: {name!r}. Known: {', '.join(sorted(resource_map)[:20])} …"
         )
     mod = importlib.import_module(f"fhir.resources.{_FHIR_VERSION}.{modname}")
     cls = getattr(mod, name, None)
@@ -267,7 +293,7 @@ def get_resource_class(name: str) -> type[BaseModel]:
 def _introspect(name: str) -> ResourceMeta:
     """Introspect a resource class and build its `ResourceMeta`."""
     cls = get_resource_class(name)
-    modname = _MODULE_MAP[name]
+    modname = _maps()[0][name]
     fields: list[FieldMeta] = []
     required: list[str] = []
 
@@ -322,11 +348,11 @@ def _introspect(name: str) -> ResourceMeta:
 def _introspect_backbone(class_name: str) -> tuple[FieldMeta, ...] | None:
     """Introspect any Pydantic class by name (backbone elements, data types, etc.).
 
-    Unlike `_introspect`, works for any class in `_CLASS_MODULE_MAP`, not just
+    Unlike `_introspect`, works for any discovered class, not just
     top-level resources.  Returns None if the class cannot be found or imported.
     Used by `spec_summary` to expand backbone element fields inline.
     """
-    modname = _CLASS_MODULE_MAP.get(class_name)
+    modname = _maps()[2].get(class_name)
     if modname is None:
         return None
     try:
@@ -418,7 +444,7 @@ _PRIMITIVES: frozenset[str] = frozenset(
 
 def resource_names() -> list[str]:
     """Sorted list of all known FHIR R4B resource type names."""
-    return sorted(_MODULE_MAP.keys())
+    return sorted(_maps()[0].keys())
 
 
 def required_fields(name: str) -> tuple[str, ...]:
@@ -469,9 +495,10 @@ def _discover_clinical_resources() -> list[str]:
     or `encounter` reference field, or if it is a foundational type
     (Patient, Practitioner, Organization, etc.).
     """
-    clinical: set[str] = set(_FOUNDATIONAL_TYPES & set(_MODULE_MAP))
+    resource_map = _maps()[0]
+    clinical: set[str] = set(_FOUNDATIONAL_TYPES & set(resource_map))
 
-    for name in _MODULE_MAP:
+    for name in resource_map:
         try:
             meta = _introspect(name)
         except ValueError:
@@ -483,7 +510,23 @@ def _discover_clinical_resources() -> list[str]:
     return sorted(clinical)
 
 
-CLINICAL_RESOURCES: list[str] = _discover_clinical_resources()
+_CLINICAL_RESOURCES: list[str] | None = None
+
+
+def clinical_resources() -> list[str]:
+    """Clinical resource types, derived lazily on first access."""
+    global _CLINICAL_RESOURCES
+    if _CLINICAL_RESOURCES is None:
+        _CLINICAL_RESOURCES = _discover_clinical_resources()
+    return _CLINICAL_RESOURCES
+
+
+def __getattr__(name: str) -> object:
+    # PEP 562 — keep the public CLINICAL_RESOURCES attribute without
+    # paying the introspection scan at import time.
+    if name == "CLINICAL_RESOURCES":
+        return clinical_resources()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _short_type(annotation: str) -> str:
@@ -528,7 +571,7 @@ def _short_type(annotation: str) -> str:
 
     for m in _re.finditer(r"\b(\w+?)Type\b", annotation):
         candidate = m.group(1)
-        if candidate in _CLASS_MODULE_MAP:
+        if candidate in _maps()[2]:
             return candidate
     return "str" if "str" in annotation else "object"
 
@@ -590,7 +633,7 @@ def spec_summary(resource_types: list[str] | None = None) -> str:
     exactly which fields are required / optional / references, along with
     their types (DateTime, Period, CodeableConcept, etc.).
     """
-    types = resource_types or CLINICAL_RESOURCES
+    types = resource_types or clinical_resources()
     lines: list[str] = [
         f"FHIR {_FHIR_VERSION} Spec — {len(types)} resource types\n",
         "DATA TYPE FORMAT RULES (from the FHIR spec):",
@@ -708,20 +751,21 @@ def import_guide(resource_types: list[str] | None = None) -> str:
     Returns:
         Multi-line string suitable for embedding in a prompt.
     """
-    types = resource_types or CLINICAL_RESOURCES
+    types = resource_types or clinical_resources()
 
     lines: list[str] = ["VALID IMPORT PATHS (use these exactly):\n", "# Resource types"]
 
     # 1. Resource modules
+    resource_map, data_type_map, _, module_classes = _maps()
     for rt in types:
-        modname = _MODULE_MAP.get(rt)
+        modname = resource_map.get(rt)
         if modname:
             lines.append(f"from fhir.resources.{_FHIR_VERSION}.{modname} import {rt}")
 
     # 2. All discovered data-type modules
     lines.append("\n# Data types (complex types used in resource fields)")
-    for modname in sorted(_DATA_TYPE_MAP.values()):
-        classes = _MODULE_CLASSES.get(modname)
+    for modname in sorted(data_type_map.values()):
+        classes = module_classes.get(modname)
         if classes:
             cls_str = ", ".join(sorted(classes))
             lines.append(f"from fhir.resources.{_FHIR_VERSION}.{modname} import {cls_str}")
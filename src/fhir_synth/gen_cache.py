@@ -0,0 +1,171 @@
+"""Structural prompt cache: reuse generated code across differing counts.
+
+The exact cache in :mod:`fhir_synth.llm_cache` misses when two prompts
+differ only in numbers ("10 patients with diabetes" vs "25 patients with
+diabetes") even though the generated code is identical up to a few integer
+literals. This tier normalizes integers out of the prompt to form a
+structural key and stores the generated code together with the exact AST
+positions of the constants that encode each slot value; on a hit only
+those constants are patched to the new values — skipping the LLM entirely.
+
+Respecialization is deliberately conservative. A slot is patchable only
+when its value (and the ``value + 1`` form LLMs pre-compute for
+``range(1, n + 1)`` upper bounds) can be attributed to a single constant
+at store time. A slot value that collides with another slot, or with an
+unrelated literal elsewhere in the code (``i % 2`` when the slot is 1, so
+2 appears both as the range bound and the modulus), is recorded as
+blocked — a lookup that would need to change it reports a miss and the
+caller falls through to the normal path instead of patching the wrong
+constants.
+"""
+
+import ast
+import json
+import logging
+import re
+
+from fhir_synth import llm_cache
+
+logger = logging.getLogger(__name__)
+
+_INT_RE = re.compile(r"\b\d+\b")
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize(prompt: str) -> tuple[str, list[int]]:
+    """Return the structural template and the integer slot values in order."""
+    slots = [int(n) for n in _INT_RE.findall(prompt)]
+    template = _WS_RE.sub(" ", _INT_RE.sub("{N}", prompt.lower())).strip()
+    return template, slots
+
+
+def _structural_key(model: str, fhir_version: str, template: str) -> str:
+    return llm_cache.cache_key(f"{model}\x00{fhir_version}", template)
+
+
+def _int_constants(tree: ast.AST) -> list[ast.Constant]:
+    """Integer `Constant` nodes in deterministic `ast.walk` order.
+
+    The order is stable for a given source string, so indices recorded at
+    store time address the same nodes when the cached code is re-parsed.
+    """
+    return [
+        node
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Constant) and type(node.value) is int
+    ]
+
+
+def _locate_slots(code: str, slots: list[int]) -> tuple[list[list[int]], list[int]] | None:
+    """Attribute the constants in *code* to the prompt's integer slots.
+
+    Returns ``(patches, blocked)`` where each patch is
+    ``[constant_index, slot_index, delta]`` (delta 1 covers the
+    ``range(1, n + 1)`` upper bound) and *blocked* lists the slots whose
+    value cannot be pinned to a single constant — it collides with another
+    slot's candidate values, appears more than once, or not at all.
+    Returns None when the code does not parse.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+
+    candidates: dict[int, list[tuple[int, int]]] = {}
+    for i, value in enumerate(slots):
+        for delta in (0, 1):
+            candidates.setdefault(value + delta, []).append((i, delta))
+
+    occurrences: dict[int, list[int]] = {}
+    for idx, node in enumerate(_int_constants(tree)):
+        const_value = node.value
+        if isinstance(const_value, int) and const_value in candidates:
+            occurrences.setdefault(const_value, []).append(idx)
+
+    patches: list[list[int]] = []
+    blocked: list[int] = []
+    for i, value in enumerate(slots):
+        slot_patches: list[list[int]] = []
+        safe = False
+        for delta in (0, 1):
+            found = occurrences.get(value + delta, [])
+            if not found:
+                continue
+            if len(found) > 1 or len(candidates[value + delta]) > 1:
+                safe = False
+                break
+            slot_patches.append([found[0], i, delta])
+            safe = True
+        if safe:
+            patches.extend(slot_patches)
+        else:
+            blocked.append(i)
+    return patches, blocked
+
+
+def _apply_patches(
+    code: str, patches: list[list[int]], new_slots: list[int], changed: set[int]
+) -> str | None:
+    """Rewrite the recorded constants for the *changed* slots in *code*."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    constants = _int_constants(tree)
+    for const_idx, slot_idx, delta in patches:
+        if slot_idx not in changed:
+            continue
+        if const_idx >= len(constants) or slot_idx >= len(new_slots):
+            return None  # meta out of sync with the stored code
+        constants[const_idx].value = new_slots[slot_idx] + delta
+    return ast.unparse(tree)
+
+
+def lookup(
+    prompt: str, model: str, fhir_version: str, cache_ttl: float | None = None
+) -> str | None:
+    """Return respecialized code for a structurally identical prior prompt.
+
+    Keyed on (model, FHIR version, template) — code generated for R4B is
+    never handed to an STU3 generator. `cache_ttl` bounds the entry age
+    the same way it does for the exact tier.
+    """
+    template, slots = _normalize(prompt)
+    key = _structural_key(model, fhir_version, template)
+    code = llm_cache.get(key, suffix=".py", ttl=cache_ttl)
+    meta_text = llm_cache.get(key, suffix=".json", ttl=cache_ttl)
+    if code is None or meta_text is None:
+        return None
+    try:
+        meta = json.loads(meta_text)
+    except json.JSONDecodeError:
+        return None
+    old_slots = meta.get("slots")
+    if not isinstance(old_slots, list) or len(old_slots) != len(slots):
+        return None
+
+    changed = {i for i, (old, new) in enumerate(zip(old_slots, slots, strict=True)) if old != new}
+    if not changed:
+        logger.info("Structural cache hit — identical slots, no LLM call")
+        return code
+    if changed & set(meta.get("blocked", [])):
+        return None  # a changed slot's constants couldn't be pinned at store time
+
+    patched = _apply_patches(code, meta.get("patches", []), slots, changed)
+    if patched is not None:
+        logger.info("Structural cache hit — respecialized cached code, no LLM call")
+    return patched
+
+
+def store(prompt: str, model: str, fhir_version: str, code: str) -> None:
+    """Record *code* as the skeleton for *prompt*'s structural template."""
+    template, slots = _normalize(prompt)
+    located = _locate_slots(code, slots)
+    if located is None:
+        return  # unparseable code could never be respecialized
+    patches, blocked = located
+    key = _structural_key(model, fhir_version, template)
+    llm_cache.set(key, code, suffix=".py")
+    llm_cache.set(
+        key, json.dumps({"slots": slots, "patches": patches, "blocked": blocked}), suffix=".json"
+    )
@@ -0,0 +1,110 @@
+"""Example prompt catalog for the CLI.
+
+Kept out of `cli.py` so the ~3 KB of example text is neither interned at
+CLI import time nor re-rendered into every `--help` screen; it is only
+loaded when the `examples` command actually runs.
+"""
+
+EXAMPLES: tuple[tuple[str, str], ...] = (
+    (
+        "Diabetes cohort with labs",
+        'fhir-synth generate "10 diabetic patients with HbA1c observations"',
+    ),
+    (
+        "Cardiology patients with encounters and meds",
+        'fhir-synth generate "5 patients with hypertension, office encounters, '
+        'and antihypertensive medications"',
+    ),
+    (
+        "Emergency department visits",
+        'fhir-synth generate "8 patients with ER encounters for chest pain, '
+        'troponin labs, and ECG procedures"',
+    ),
+    (
+        "Oncology cohort",
+        'fhir-synth generate "6 lung cancer patients with staging observations, '
+        'chemotherapy medication requests, and CT scan diagnostic reports"',
+    ),
+    (
+        "Pediatric immunizations",
+        'fhir-synth generate "10 pediatric patients aged 0-5 with immunization '
+        'records for DTaP, MMR, and IPV"',
+    ),
+    (
+        "Mental health",
+        'fhir-synth generate "5 patients with major depressive disorder, '
+        'PHQ-9 observations, and SSRI prescriptions"',
+    ),
+    (
+        "Prenatal care",
+        'fhir-synth generate "4 pregnant patients with prenatal encounters, '
+        'ultrasound procedures, and pregnancy-related observations"',
+    ),
+    (
+        "Multi-condition elderly",
+        'fhir-synth generate "10 elderly patients aged 65-90 with diabetes, '
+        'hypertension, CKD, encounters, labs, and medications"',
+    ),
+    (
+        "Surgical patients",
+        'fhir-synth generate "5 patients with appendectomy procedures, pre-op '
+        'encounters, and post-op follow-up encounters"',
+    ),
+    (
+        "Allergy and immunology",
+        'fhir-synth generate "8 patients with allergy intolerances to penicillin '
+        'and peanuts, plus related encounters"',
+    ),
+    (
+        "EMPI cross-system linkage",
+        'fhir-synth generate "3 patients" --empi --persons 3 --systems emr1,emr2,lab_system',
+    ),
+    (
+        "With metadata (security labels, tags, profiles)",
+        'fhir-synth generate "10 patients" --meta-config examples/meta-normal.yaml',
+    ),
+    (
+        "Split into per-patient files (also creates the NDJSON)",
+        'fhir-synth generate "20 patients with conditions" --split',
+    ),
+    (
+        "AWS Bedrock provider",
+        'fhir-synth generate "5 patients" --provider '
+        "bedrock/us.anthropic.claude-3-5-sonnet-20241022-v2:0 "
+        "--aws-profile my-profile --aws-region us-east-1",
+    ),
+    (
+        "Docker sandbox executor (requires Docker)",
+        'fhir-synth generate "5 patients" --executor docker',
+    ),
+    (
+        "E2B cloud sandbox (requires E2B_API_KEY env var)",
+        'fhir-synth generate "5 patients" --executor e2b',
+    ),
+    (
+        "Blaxel cloud sandbox",
+        'fhir-synth generate "5 patients" --executor blaxel',
+    ),
+    (
+        "Generate STU3 resources instead of R4B",
+        'fhir-synth generate "10 patients with diabetes" --fhir-version STU3',
+    ),
+    (
+        "Use custom skills directory",
+        'fhir-synth generate "5 patients" --skills-dir ~/.fhir-synth/skills',
+    ),
+    (
+        "Force keyword (zero-dependency, no embeddings) skill selection",
+        'fhir-synth generate "5 patients" --selector keyword',
+    ),
+    (
+        "Semantic selection (default) with a custom cosine threshold",
+        'fhir-synth generate "5 patients" --score-threshold 0.6',
+    ),
+)
+
+
+def format_examples() -> str:
+    """Render the catalog as the text shown by `fhir-synth examples`."""
+    blocks = [f"# {title}\n{command}" for title, command in EXAMPLES]
+    return "\n\n".join(blocks)
@@ -2,6 +2,7 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
 
@@ -76,12 +77,10 @@ class LLMProvider:
 
         return kwargs
 
-    def generate_text(
-        self, prompt: str, system: str | None = None, json_schema: dict[str, Any] | None = None
-    ) -> str:
-        """Generate text from prompt using LiteLLM."""
-        import litellm
-
+    def _completion_kwargs(
+        self, prompt: str, system: str | None, json_schema: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Build the kwargs dict shared by sync and async completion calls."""
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
@@ -106,7 +105,28 @@ class LLMProvider:
         if json_schema:
             kwargs["response_format"] = {"type": "json_object"}
 
-        response = litellm.completion(**kwargs)
+        return kwargs
+
+    def generate_text(
+        self, prompt: str, system: str | None = None, json_schema: dict[str, Any] | None = None
+    ) -> str:
+        """Generate text from prompt using LiteLLM."""
+        import litellm
+
+        response = litellm.completion(**self._completion_kwargs(prompt, system, json_schema))
+        return response.choices[0].message.content or ""
+
+    async def generate_text_async(
+        self, prompt: str, system: str | None = None, json_schema: dict[str, Any] | None = None
+    ) -> str:
+        """Async counterpart of `generate_text` via `litellm.acompletion`.
+
+        Lets async callers (e.g. `generate-batch`) run many in-flight
+        requests on one event loop instead of a thread per call.
+        """
+        import litellm
+
+        response = await litellm.acompletion(**self._completion_kwargs(prompt, system, json_schema))
         return response.choices[0].message.content or ""
 
     def generate_json(
@@ -148,9 +168,19 @@ class MockLLMProvider(LLMProvider):
         elif isinstance(self.response, dict):
             return json.dumps(self.response)
         else:
-            # Default mock: return Python code that generates sample resources.
-            # This allows `fhir-synth generate --provider mock` to work end-to-end.
-            return """
+            return self._default_code()
+
+    async def generate_text_async(
+        self, prompt: str, system: str | None = None, json_schema: dict[str, Any] | None = None
+    ) -> str:
+        """Async mock — same canned response, no network."""
+        return self.generate_text(prompt, system, json_schema)
+
+    @staticmethod
+    def _default_code() -> str:
+        # Default mock: return Python code that generates sample resources.
+        # This allows `fhir-synth generate --provider mock` to work end-to-end.
+        return """
 from fhir.resources.R4B import patient as patient_mod
 
 def generate_resources():
@@ -204,10 +234,22 @@ def get_provider(
     if provider_name == "mock":
         return MockLLMProvider(**kwargs)
 
+    # Library callers may not have gone through the CLI callback that
+    # loads `.env` — pick up API keys here, right before they're needed.
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     # LiteLLM resolves the provider-appropriate env var (OPENAI_API_KEY,
     # ANTHROPIC_API_KEY, etc.) internally when api_key is None — no need to
     # mirror its table here.
 
+    if not kwargs:
+        # Common case — reuse one provider per configuration so callers in a
+        # loop (generate-batch, library use) share litellm's warm client
+        # state. Mock stays uncached: tests inspect its per-instance `calls`.
+        return _cached_provider(provider_name, api_key, aws_profile, aws_region)
+
     return LLMProvider(
         model=provider_name,
         api_key=api_key,
@@ -215,3 +257,19 @@ def get_provider(
         aws_region_name=aws_region,
         **kwargs,
     )
+
+
+@lru_cache(maxsize=8)
+def _cached_provider(
+    model: str,
+    api_key: str | None,
+    aws_profile: str | None,
+    aws_region: str | None,
+) -> LLMProvider:
+    """Construct (once) an `LLMProvider` for a kwargs-free configuration."""
+    return LLMProvider(
+        model=model,
+        api_key=api_key,
+        aws_profile_name=aws_profile,
+        aws_region_name=aws_region,
+    )
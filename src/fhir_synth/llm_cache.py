@@ -0,0 +1,111 @@
+"""Persistent on-disk cache for LLM-generated artifacts.
+
+Development and CI workflows often re-issue the same prompt; the LLM call
+dominates wall-clock time at seconds-to-minutes scale, while a cache hit
+returns in milliseconds. Artifacts are content-addressed by a BLAKE2b hash
+of (provider, prompt) and stored as plain files under
+`~/.cache/fhir-synth/` (override with `FHIR_SYNTH_CACHE_DIR`).
+"""
+
+import hashlib
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_CACHE_DIR_ENV = "FHIR_SYNTH_CACHE_DIR"
+
+
+def cache_dir() -> Path:
+    """Return the artifact cache directory.
+
+    Defaults to `~/.cache/fhir-synth/`; set `FHIR_SYNTH_CACHE_DIR` to
+    relocate (useful in CI and tests).
+    """
+    override = os.getenv(_CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "fhir-synth"
+
+
+def cache_key(provider: str, prompt: str) -> str:
+    """Content-address a (provider, prompt) pair.
+
+    Args:
+        provider: LLM provider/model name.
+        prompt: Full prompt text sent to the LLM.
+
+    Returns:
+        Hex digest suitable for use as a filename.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(provider.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+# In-process tier: repeated hits within one run (e.g. duplicate prompts in
+# generate-batch) skip the file read. Entries are validated against the
+# file's mtime so an external cache update is never masked.
+_MEM_CACHE: dict[tuple[str, str], tuple[float, str]] = {}
+
+
+def get(key: str, suffix: str = ".py", ttl: float | None = None) -> str | None:
+    """Return the cached artifact for *key*, or None on a miss/stale entry.
+
+    Args:
+        key: Cache key (see `cache_key`).
+        suffix: Stored file suffix (`.py` for code, `.json` for rules).
+        ttl: Maximum age in seconds before a hit is considered stale.
+            `None` means entries never expire.
+    """
+    path = cache_dir() / f"{key}{suffix}"
+    if not path.exists():
+        return None
+    mtime = path.stat().st_mtime
+    if ttl is not None and time.time() - mtime > ttl:
+        return None
+
+    cached = _MEM_CACHE.get((key, suffix))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    artifact = path.read_text()
+    _MEM_CACHE[(key, suffix)] = (mtime, artifact)
+    return artifact
+
+
+def set(key: str, artifact: str, suffix: str = ".py") -> None:
+    """Store *artifact* under *key*."""
+    path = cache_dir() / f"{key}{suffix}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(artifact)
+    _MEM_CACHE[(key, suffix)] = (path.stat().st_mtime, artifact)
+
+
+def get_or_compute(
+    key: str,
+    fn: Callable[[], str],
+    suffix: str = ".py",
+    ttl: float | None = None,
+) -> str:
+    """Return the cached artifact for *key*, computing and storing on miss.
+
+    Args:
+        key: Cache key (see `cache_key`).
+        fn: Zero-arg callable producing the artifact text on a miss.
+        suffix: Stored file suffix (`.py` for code, `.json` for rules).
+        ttl: Maximum age in seconds before a hit is considered stale.
+            `None` means entries never expire.
+
+    Returns:
+        The artifact text, from cache or freshly computed.
+    """
+    artifact = get(key, suffix=suffix, ttl=ttl)
+    if artifact is not None:
+        return artifact
+
+    artifact = fn()
+    set(key, artifact, suffix=suffix)
+    return artifact
@@ -231,7 +231,7 @@ async def generate_fhir_data(
             is always written to NDJSON). Use ``get_run`` to fetch the rest.
     """
     from fhir_synth.bundle import (
-        split_resources_by_patient,
+        iter_split_bundles,
         write_ndjson,
         write_split_bundles,
     )
@@ -352,11 +352,19 @@ async def generate_fhir_data(
         )
         await reporter.info("   Applied metadata from config")
 
-    per_patient = split_resources_by_patient(resources)
-    write_ndjson(per_patient, ndjson_path)
-    await reporter.info(f"✓  {len(per_patient)} patient bundles → {ndjson_path}")
+    # Stream bundles from the splitter into the writers — no full list held.
+    bundle_count = 0
+
+    def _counted() -> Any:
+        nonlocal bundle_count
+        for bundle in iter_split_bundles(resources):
+            bundle_count += 1
+            yield bundle
+
+    write_ndjson(_counted(), ndjson_path)
+    await reporter.info(f"✓  {bundle_count} patient bundles → {ndjson_path}")
     if split:
-        paths = write_split_bundles(per_patient, run_dir)
+        paths = write_split_bundles(iter_split_bundles(resources), run_dir)
         await reporter.info(f"✓  {len(paths)} patient files → {run_dir}/")
     await reporter.progress(5, total_steps, "output written")
     await reporter.progress(6, total_steps, "done")
@@ -371,7 +379,7 @@ async def generate_fhir_data(
         "code_path": str(code_path),
         "ndjson_path": str(ndjson_path),
         "resource_count": len(resources),
-        "patient_count": len(per_patient),
+        "patient_count": bundle_count,
         "selected_skills": selected_skills,
         "quality": quality,
         "resources": resources[:max_resources_returned],
@@ -0,0 +1,186 @@
+"""Template fast path for structurally simple prompts.
+
+A large share of real prompts follow a handful of shapes ("10 diabetic
+patients", "5 patients with hypertension", "3 copd patients with FEV1
+observations") that differ only in counts and clinical terms.  For those,
+round-tripping to an LLM spends seconds and tokens to produce code we can
+write down once.  This module keeps a small set of (regex, code template)
+pairs; when a prompt matches, the template is filled locally in
+microseconds and the LLM is never called.
+
+Anything that doesn't match cleanly — extra constraints, multiple
+cohorts, free-form detail — falls through to normal generation, so the
+fast path can only ever remove latency, not capability.
+"""
+
+import re
+from functools import lru_cache
+from string import Template
+
+# Clinical term fragments: lowercase words/hyphens, lazily matched so the
+# surrounding keywords ("patients", "observations") anchor the boundaries.
+_TERM = r"[a-z][a-z0-9 -]*?"
+
+_PATIENTS_ONLY = Template("""\
+from fhir.resources.$fhir_version import patient as patient_mod
+
+
+def generate_resources():
+    resources = []
+    for i in range(1, $n + 1):
+        p = patient_mod.Patient(
+            id=f"pat-{i}",
+            name=[{"given": [f"Given{i}"], "family": f"Family{i}"}],
+            gender="male" if i % 2 else "female",
+            birthDate=f"19{50 + (i * 7) % 50:02d}-0{1 + i % 9}-0{1 + i % 9}",
+        )
+        resources.append(p.model_dump())
+    return resources
+""")
+
+_PATIENTS_WITH_CONDITION = Template("""\
+from fhir.resources.$fhir_version import condition as condition_mod
+from fhir.resources.$fhir_version import patient as patient_mod
+
+
+def generate_resources():
+    resources = []
+    for i in range(1, $n + 1):
+        p = patient_mod.Patient(
+            id=f"pat-{i}",
+            name=[{"given": [f"Given{i}"], "family": f"Family{i}"}],
+            gender="male" if i % 2 else "female",
+            birthDate=f"19{50 + (i * 7) % 50:02d}-0{1 + i % 9}-0{1 + i % 9}",
+        )
+        resources.append(p.model_dump())
+        c = condition_mod.Condition(
+            id=f"cond-{i}",
+            subject={"reference": f"Patient/pat-{i}"},
+            code={"text": "$condition"},
+        )
+        resources.append(c.model_dump())
+    return resources
+""")
+
+_PATIENTS_WITH_CONDITION_AND_OBS = Template("""\
+from fhir.resources.$fhir_version import condition as condition_mod
+from fhir.resources.$fhir_version import observation as observation_mod
+from fhir.resources.$fhir_version import patient as patient_mod
+
+
+def generate_resources():
+    resources = []
+    for i in range(1, $n + 1):
+        p = patient_mod.Patient(
+            id=f"pat-{i}",
+            name=[{"given": [f"Given{i}"], "family": f"Family{i}"}],
+            gender="male" if i % 2 else "female",
+            birthDate=f"19{50 + (i * 7) % 50:02d}-0{1 + i % 9}-0{1 + i % 9}",
+        )
+        resources.append(p.model_dump())
+        c = condition_mod.Condition(
+            id=f"cond-{i}",
+            subject={"reference": f"Patient/pat-{i}"},
+            code={"text": "$condition"},
+        )
+        resources.append(c.model_dump())
+        o = observation_mod.Observation(
+            id=f"obs-{i}",
+            status="final",
+            code={"text": "$observation"},
+            subject={"reference": f"Patient/pat-{i}"},
+        )
+        resources.append(o.model_dump())
+    return resources
+""")
+
+
+@lru_cache(maxsize=1)
+def _entries() -> tuple[tuple[re.Pattern[str], Template], ...]:
+    """Compiled (pattern, template) pairs, most specific first.
+
+    Built lazily so importing the package doesn't pay for regex
+    compilation; the whole prompt must match (with optional lead-ins like
+    "generate"/"create") — partial matches fall through to the LLM.
+    """
+    lead = r"(?:generate|create|make)?\s*"
+    specs: list[tuple[str, Template]] = [
+        (
+            rf"{lead}(?P<n>\d+)\s+(?P<condition>{_TERM})\s+patients?"
+            rf"\s+with\s+(?P<observation>{_TERM})\s+observations?",
+            _PATIENTS_WITH_CONDITION_AND_OBS,
+        ),
+        (
+            rf"{lead}(?P<n>\d+)\s+patients?\s+with\s+(?P<condition>{_TERM})"
+            rf"\s+(?:and\s+)?(?P<observation>{_TERM})\s+observations?",
+            _PATIENTS_WITH_CONDITION_AND_OBS,
+        ),
+        (
+            rf"{lead}(?P<n>\d+)\s+(?P<condition>{_TERM})\s+patients?",
+            _PATIENTS_WITH_CONDITION,
+        ),
+        (
+            rf"{lead}(?P<n>\d+)\s+patients?\s+with\s+(?P<condition>{_TERM})",
+            _PATIENTS_WITH_CONDITION,
+        ),
+        (rf"{lead}(?P<n>\d+)\s+patients?", _PATIENTS_ONLY),
+    ]
+    return tuple(
+        (re.compile(rf"^\s*{body}\s*\.?\s*$", re.IGNORECASE), template) for body, template in specs
+    )
+
+
+@lru_cache(maxsize=4)
+def _resource_nouns(fhir_version: str) -> frozenset[str]:
+    """Lowercased FHIR resource-type names ("observation", "encounter", …).
+
+    Keyed on the version the caller is generating for (the generator sets
+    the global spec version before consulting this module).
+    """
+    from fhir_synth.fhir_spec import resource_names
+
+    return frozenset(name.lower() for name in resource_names())
+
+
+def _names_resource_type(term: str, fhir_version: str) -> bool:
+    """True when *term* ends in a FHIR resource-type noun.
+
+    The lazy condition capture can swallow trailing resource nouns — "10
+    patients with hba1c observations" would otherwise become a Condition
+    with ``code.text = "hba1c observations"`` and zero Observations.
+    Such prompts ask for resources the template doesn't create and must
+    fail over to the LLM instead of returning a wrong-shape dataset.
+    Checks the last word and the joined last two words, so multi-word
+    types ("medication requests" → MedicationRequest) are caught too.
+    """
+    nouns = _resource_nouns(fhir_version)
+    words = term.split()
+    tails = {words[-1]}
+    if len(words) >= 2:
+        tails.add(words[-2] + words[-1])
+    return any(tail in nouns or tail.removesuffix("s") in nouns for tail in tails)
+
+
+def lookup(prompt: str, fhir_version: str = "R4B") -> str | None:
+    """Return ready-to-execute code for *prompt*, or None to use the LLM.
+
+    Args:
+        prompt: The user's natural-language prompt.
+        fhir_version: FHIR version for the generated imports.
+
+    Returns:
+        Filled template code when the prompt matches a known shape,
+        otherwise None.
+    """
+    for pattern, template in _entries():
+        match = pattern.match(prompt)
+        if match is None:
+            continue
+        fields = {k: v.strip().lower() for k, v in match.groupdict().items() if v}
+        if any(
+            _names_resource_type(value, fhir_version) for key, value in fields.items() if key != "n"
+        ):
+            continue
+        fields["fhir_version"] = fhir_version
+        return template.substitute(fields)
+    return None
@@ -0,0 +1,189 @@
+"""Semantic cache for near-duplicate prompts.
+
+The exact-match cache in :mod:`fhir_synth.llm_cache` misses on trivially
+reworded prompts ("10 diabetic patients" vs "ten diabetic patients") even
+though the generated code is identical.  This layer embeds prompts with
+`fastembed` (the same local ONNX models used by
+:class:`~fhir_synth.skills.selector.SemanticSelector`) and returns a stored
+artifact when cosine similarity to a previous prompt clears a threshold.
+
+Vectors and artifacts are persisted under a ``semantic/`` subdirectory of
+:func:`fhir_synth.llm_cache.cache_dir` (honours ``FHIR_SYNTH_CACHE_DIR``)
+so hits survive across CLI invocations.  The index and artifact keys are
+namespaced by the LLM model and FHIR version — like the exact and
+structural tiers, code cached for an R4B run is never returned to an
+STU3 run or a different provider.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from fhir_synth import llm_cache
+from fhir_synth.skills.selector import DEFAULT_EMBED_MODEL
+
+logger = logging.getLogger(__name__)
+
+
+def _default_cache_dir() -> Path:
+    """Semantic subdirectory of the shared artifact cache root."""
+    return llm_cache.cache_dir() / "semantic"
+
+
+class SemanticCache:
+    """Embedding-based prompt→artifact cache.
+
+    Args:
+        model_name: fastembed model name (default
+            ``"BAAI/bge-small-en-v1.5"``, shared with the skill selector so
+            the model is only downloaded once).
+        threshold: Minimum cosine similarity for a hit (default 0.92 —
+            high enough that only rewordings match, not different cohorts).
+        cache_dir: Directory for vectors and artifacts.  Defaults to the
+            ``semantic/`` subdirectory of the shared cache root (see
+            :func:`fhir_synth.llm_cache.cache_dir`).
+        llm_model: LLM model/provider the artifacts were generated with.
+            Part of the cache namespace.
+        fhir_version: FHIR version the artifacts target.  Part of the
+            cache namespace.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBED_MODEL,
+        threshold: float = 0.92,
+        cache_dir: Path | None = None,
+        llm_model: str = "gpt-4",
+        fhir_version: str = "R4B",
+    ) -> None:
+        self.model_name = model_name
+        self.threshold = threshold
+        self.cache_dir = cache_dir or _default_cache_dir()
+        self.llm_model = llm_model
+        self.fhir_version = fhir_version
+
+        # Lazy state — model and index are loaded on first use
+        self._model: Any = None
+        self._vectors: Any = None  # numpy.ndarray, shape (N, dim), L2-normalised
+        self._keys: list[str] = []
+        self._loaded = False
+
+    # ── Embedding ───────────────────────────────────────────────────
+
+    def _embed(self, text: str) -> Any:
+        """Embed *text* and return an L2-normalised float32 vector."""
+        import numpy as np
+
+        if self._model is None:
+            from fastembed import TextEmbedding
+
+            self._model = TextEmbedding(model_name=self.model_name)
+
+        vec = np.array(next(iter(self._model.embed([text]))), dtype=np.float32)
+        return vec / max(float(np.linalg.norm(vec)), 1e-12)
+
+    # ── Persistence ─────────────────────────────────────────────────
+
+    def _namespace(self) -> str:
+        """Hex digest isolating this (LLM model, FHIR version) pair."""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(self.llm_model.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(self.fhir_version.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _paths(self) -> tuple[Path, Path]:
+        """Return ``(vectors_path, meta_path)`` for the current namespace."""
+        prefix = f"{self.model_name.replace('/', '_')}_{self._namespace()}"
+        return self.cache_dir / f"{prefix}.npy", self.cache_dir / f"{prefix}.json"
+
+    def _load(self) -> None:
+        """Load the persisted index, if any. Safe to call repeatedly."""
+        import numpy as np
+
+        if self._loaded:
+            return
+        self._loaded = True
+
+        vectors_path, meta_path = self._paths()
+        if not vectors_path.exists() or not meta_path.exists():
+            return
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("model") != self.model_name:
+                return
+            self._keys = list(meta.get("keys", []))
+            self._vectors = np.load(vectors_path)
+        except (OSError, ValueError, json.JSONDecodeError):
+            logger.debug("Corrupt semantic cache at %s", self.cache_dir, exc_info=True)
+            self._keys = []
+            self._vectors = None
+
+    def _save(self) -> None:
+        """Persist vectors + keys to disk."""
+        import numpy as np
+
+        vectors_path, meta_path = self._paths()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        np.save(vectors_path, self._vectors)
+        meta = {"model": self.model_name, "keys": self._keys}
+        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    # ── Public API ──────────────────────────────────────────────────
+
+    def lookup(self, prompt: str) -> str | None:
+        """Return the stored artifact for the closest prior prompt, or None.
+
+        Any failure (missing model, corrupt index) is logged and treated
+        as a miss so the caller always falls through to the LLM.
+        """
+        try:
+            self._load()
+            if self._vectors is None or not self._keys:
+                return None
+
+            query = self._embed(prompt)
+            scores = self._vectors @ query
+            best = int(scores.argmax())
+            if float(scores[best]) < self.threshold:
+                return None
+
+            artifact_path = self.cache_dir / f"{self._keys[best]}.py"
+            if not artifact_path.exists():
+                return None
+            logger.info(
+                "Semantic cache hit (similarity %.3f) → %s",
+                float(scores[best]),
+                artifact_path.name,
+            )
+            return artifact_path.read_text()
+        except Exception:
+            logger.warning("Semantic cache lookup failed — treating as miss", exc_info=True)
+            return None
+
+    def store(self, prompt: str, artifact: str) -> None:
+        """Add *prompt* → *artifact* to the cache (best-effort)."""
+        import numpy as np
+
+        try:
+            self._load()
+            key = hashlib.blake2b(
+                f"{self._namespace()}\x00{prompt}".encode(), digest_size=16
+            ).hexdigest()
+            if key in self._keys:
+                return
+
+            vec = self._embed(prompt)
+            if self._vectors is None:
+                self._vectors = vec.reshape(1, -1)
+            else:
+                self._vectors = np.vstack([self._vectors, vec])
+            self._keys.append(key)
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.py").write_text(artifact)
+            self._save()
+        except Exception:
+            logger.warning("Semantic cache store failed", exc_info=True)
@@ -19,6 +19,7 @@ import hashlib
 import json
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
@@ -73,6 +74,12 @@ def _tokenize(text: str) -> set[str]:
     return {w.lower() for w in _TOKEN_RE.findall(text)} - _STOP_WORDS
 
 
+@lru_cache(maxsize=256)
+def _lowered_types(resource_types: tuple[str, ...]) -> tuple[str, ...]:
+    """Lowercased resource types, cached per skill's fixed type tuple."""
+    return tuple(rt.lower() for rt in resource_types)
+
+
 class KeywordSelector:
     """Select skills by token overlap between the prompt and skill description.
 
@@ -129,9 +136,11 @@ class KeywordSelector:
 
             score = 0
 
-            # Resource types — high-signal structural match
-            for rt in skill.resource_types:
-                rt_lower = rt.lower()
+            # Resource types — high-signal structural match. Per-type
+            # substring test (C-level, a handful of types per skill) so
+            # overlapping names like Medication/MedicationRequest each
+            # score; fuzzy-check only the types that didn't hit exactly.
+            for rt_lower in _lowered_types(tuple(skill.resource_types)):
                 if rt_lower in prompt_lower:
                     score += 2
                 elif self._fuzzy_match(rt_lower, prompt_tokens):
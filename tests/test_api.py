@@ -0,0 +1,33 @@
+"""Tests for the programmatic (non-CLI) entry points."""
+
+from fhir_synth import api
+
+
+def test_get_code_generator_reuses_instances():
+    a = api.get_code_generator("mock", "R4B")
+    b = api.get_code_generator("mock", "R4B")
+    assert a is b
+    assert api.get_code_generator("mock", "STU3") is not a
+
+
+def test_get_code_generator_reasserts_fhir_version_on_reuse():
+    """A cache hit must restore the global spec version its prompts expect."""
+    from fhir_synth import fhir_spec
+
+    original = fhir_spec.get_fhir_version()
+    try:
+        api.get_code_generator("mock", "R4B")
+        api.get_code_generator("mock", "STU3")
+        assert fhir_spec.get_fhir_version() == "STU3"
+
+        api.get_code_generator("mock", "R4B")
+        assert fhir_spec.get_fhir_version() == "R4B"
+    finally:
+        fhir_spec.set_fhir_version(original)
+
+
+def test_generate_returns_resources(tmp_path, monkeypatch):
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    resources = api.generate("an ER visit with labs", provider="mock")
+    assert resources
+    assert all(r["resourceType"] == "Patient" for r in resources)
@@ -1,5 +1,9 @@
 """Tests for bundle builder."""
 
+import io
+import json
+import random
+
 from fhir_synth.bundle import BundleBuilder
 
 
@@ -24,3 +28,46 @@ def test_bundle_builder_adds_request_url():
     bundle = builder.build()
 
     assert bundle["entry"][0]["request"]["url"] == "Patient/p2"
+
+
+def test_bundle_builder_build_stream_round_trips():
+    builder = BundleBuilder(bundle_type="collection")
+    builder.add_resource({"resourceType": "Patient", "id": "p1"})
+    builder.add_resource({"resourceType": "Condition", "id": "c1"})
+
+    buf = io.BytesIO()
+    builder.build_stream(buf)
+    bundle = json.loads(buf.getvalue())
+
+    assert bundle["resourceType"] == "Bundle"
+    assert bundle["type"] == "collection"
+    assert bundle["total"] == 2
+    assert [e["resource"]["id"] for e in bundle["entry"]] == ["p1", "c1"]
+
+
+def test_id_pool_is_unique_under_concurrency():
+    """Concurrent builders must never be handed the same pool bytes."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from fhir_synth.bundle.builder import _ID_POOL
+
+    def draw(n):
+        return [_ID_POOL.next_id() for _ in range(n)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        batches = list(pool.map(draw, [2000] * 8))
+
+    ids = [i for batch in batches for i in batch]
+    assert len(set(ids)) == len(ids)
+
+
+def test_bundle_builder_seeded_rng_is_reproducible():
+    def build(seed):
+        builder = BundleBuilder(rng=random.Random(seed))
+        builder.add_resource({"resourceType": "Patient"})
+        return builder.build()
+
+    a, b = build(42), build(42)
+    assert a["id"] == b["id"]
+    assert a["entry"][0]["fullUrl"] == b["entry"][0]["fullUrl"]
+    assert build(42)["id"] != build(7)["id"]
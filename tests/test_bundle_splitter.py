@@ -3,12 +3,26 @@
 import json
 
 from fhir_synth.bundle.splitter import (
+    iter_split_bundles,
     split_resources_by_patient,
     write_ndjson,
     write_split_bundles,
 )
 
 
+def test_iter_split_bundles_streams_lazily():
+    resources = [
+        {"resourceType": "Patient", "id": "p1"},
+        {"resourceType": "Patient", "id": "p2"},
+    ]
+
+    it = iter_split_bundles(resources)
+
+    first = next(it)
+    assert first["entry"][0]["resource"]["id"] == "p1"
+    assert [b["entry"][0]["resource"]["id"] for b in it] == ["p2"]
+
+
 def test_split_groups_resources_by_patient():
     resources = [
         {"resourceType": "Patient", "id": "p1"},
@@ -46,6 +60,25 @@ def test_split_includes_unlinked_in_every_bundle():
         assert "Organization" in types
 
 
+def test_split_shared_unlinked_false_emits_shared_bundle():
+    resources = [
+        {"resourceType": "Patient", "id": "p1"},
+        {"resourceType": "Patient", "id": "p2"},
+        {"resourceType": "Organization", "id": "org1"},  # no patient ref
+    ]
+
+    bundles = split_resources_by_patient(resources, shared_unlinked=False)
+
+    assert len(bundles) == 3
+    # Patient bundles contain only their own resources
+    for b in bundles[:2]:
+        types = [e["resource"]["resourceType"] for e in b["entry"]]
+        assert "Organization" not in types
+    # Trailing shared bundle holds the unlinked Organization
+    shared_types = [e["resource"]["resourceType"] for e in bundles[2]["entry"]]
+    assert shared_types == ["Organization"]
+
+
 def test_split_no_patients_returns_single_bundle():
     resources = [
         {"resourceType": "Organization", "id": "org1"},
@@ -6,6 +6,7 @@ from fhir_synth.code_generator import CodeGenerator
 from fhir_synth.code_generator.executor import (
     LocalSmolagentsExecutor,
     fix_common_imports,
+    quick_fix,
     validate_code,
     validate_imports,
 )
@@ -88,6 +89,17 @@ def test_code_generator_extracts_code_block():
     assert "print('hi')" in code
 
 
+def test_code_generator_batch_preserves_order():
+    import asyncio
+
+    response = """```python\nprint('hi')\n```"""
+    llm = MockLLMProvider(response=response)
+    code_gen = CodeGenerator(llm)
+    codes = asyncio.run(code_gen.generate_code_from_prompt_batch(["a", "b", "c"], use_cache=False))
+    assert len(codes) == 3
+    assert all("print('hi')" in c for c in codes)
+
+
 def test_code_generator_executes_generated_code():
     code = (
         "from fhir.resources.R4B import patient\n"
@@ -204,6 +216,48 @@ def test_validate_imports_detects_bad_module():
     assert any("timing" in e for e in errors)
 
 
+def test_validate_imports_rejects_disallowed_module():
+    errors = validate_imports("import os\nfrom subprocess import run\n")
+    assert any("os" in e and "not allowed" in e for e in errors)
+    assert any("subprocess" in e and "not allowed" in e for e in errors)
+
+
+def test_validate_imports_rejects_blocked_builtin_calls():
+    errors = validate_imports("result = eval('1 + 1')\n")
+    assert any("eval()" in e for e in errors)
+
+
+def test_validate_imports_ignores_blocked_names_in_strings():
+    assert validate_imports("note = 'do not use eval() here'\n") == []
+
+
+def test_quick_fix_strips_stray_markdown_fences():
+    code = "```python\ndef generate_resources():\n    return []\n```\n"
+    fixed = quick_fix(code, "Generated code is not valid Python")
+    assert fixed is not None
+    assert "```" not in fixed
+    assert validate_code(fixed)
+
+
+def test_quick_fix_adds_missing_common_import():
+    code = "def generate_resources():\n    return [{'value': Decimal('1.5')}]\n"
+    fixed = quick_fix(code, "name 'Decimal' is not defined")
+    assert fixed is not None
+    assert fixed.startswith("from decimal import Decimal\n")
+
+
+def test_quick_fix_returns_none_when_no_local_fix_applies():
+    assert quick_fix("def broken(:\n", "Generated code is not valid Python") is None
+    assert quick_fix("x = 1\n", "name 'obscure_helper' is not defined") is None
+
+
+def test_validate_imports_accepts_allowlisted_modules():
+    code = (
+        "import uuid\nfrom datetime import date\nfrom fhir.resources.R4B.patient import Patient\n"
+    )
+    assert validate_imports(code) == []
+
+
 # ── validate_code (syntax only — security is smolagents' job) ─────────────
 
 
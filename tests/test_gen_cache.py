@@ -0,0 +1,112 @@
+"""Tests for the structural (count-insensitive) prompt cache."""
+
+from fhir_synth import gen_cache
+
+_CODE = """\
+def generate_resources():
+    resources = []
+    for i in range(1, 11):
+        resources.append({"resourceType": "Patient", "id": f"p-{i}"})
+    return resources
+"""
+
+
+def test_normalize_extracts_integer_slots():
+    template, slots = gen_cache._normalize("10 patients with 3 encounters")
+    assert template == "{N} patients with {N} encounters"
+    assert slots == [10, 3]
+
+
+def test_lookup_respecializes_counts(tmp_path, monkeypatch):
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    gen_cache.store("10 diabetic patients", "mock", "R4B", _CODE)
+
+    patched = gen_cache.lookup("25 diabetic patients", "mock", "R4B")
+    assert patched is not None
+    assert "range(1, 26)" in patched
+
+    namespace: dict = {}
+    exec(patched, namespace)
+    assert len(namespace["generate_resources"]()) == 25
+
+
+def test_lookup_misses_on_different_structure(tmp_path, monkeypatch):
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    gen_cache.store("10 diabetic patients", "mock", "R4B", _CODE)
+
+    assert gen_cache.lookup("10 hypertensive patients", "mock", "R4B") is None
+    assert gen_cache.lookup("10 diabetic patients with 2 labs", "mock", "R4B") is None
+
+
+def test_lookup_misses_on_different_fhir_version(tmp_path, monkeypatch):
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    gen_cache.store("10 diabetic patients", "mock", "R4B", _CODE)
+
+    assert gen_cache.lookup("10 diabetic patients", "mock", "STU3") is None
+
+
+def test_lookup_identical_slots_returns_code_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    gen_cache.store("10 diabetic patients", "mock", "R4B", _CODE)
+    assert gen_cache.lookup("10 diabetic patients", "mock", "R4B") == _CODE
+
+
+def test_lookup_misses_when_slot_collides_with_unrelated_literal(tmp_path, monkeypatch):
+    # The slot value 1 pre-computes to a range bound of 2, which also
+    # appears as an unrelated modulus — patching by value would corrupt
+    # the gender alternation, so the lookup must miss instead.
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    code = """\
+def generate_resources():
+    resources = []
+    for i in range(1, 2):
+        gender = "male" if i % 2 else "female"
+        resources.append({"resourceType": "Patient", "id": f"p-{i}", "gender": gender})
+    return resources
+"""
+    gen_cache.store("1 sepsis admission with vitals", "mock", "R4B", code)
+
+    assert gen_cache.lookup("4 sepsis admission with vitals", "mock", "R4B") is None
+    # Identical slots still hit — nothing needs patching.
+    assert gen_cache.lookup("1 sepsis admission with vitals", "mock", "R4B") == code
+
+
+def test_lookup_patches_only_the_slot_constants(tmp_path, monkeypatch):
+    # An unrelated literal equal to old_slot + 1 elsewhere in the code
+    # must survive respecialization untouched.
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    code = """\
+def generate_resources():
+    resources = []
+    for i in range(10):
+        resources.append({"resourceType": "Patient", "id": f"p-{i}", "multipleBirthInteger": 2})
+    return resources
+"""
+    gen_cache.store("10 twin patients", "mock", "R4B", code)
+
+    patched = gen_cache.lookup("25 twin patients", "mock", "R4B")
+    assert patched is not None
+    assert "range(25)" in patched
+    assert "'multipleBirthInteger': 2" in patched
+
+
+def test_lookup_rejects_ambiguous_duplicate_slots(tmp_path, monkeypatch):
+    # Two slots share the value 5 — neither can be pinned to a constant.
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    gen_cache.store("5 patients with 5 labs", "mock", "R4B", "x = 5\n")
+    assert gen_cache.lookup("7 patients with 9 labs", "mock", "R4B") is None
+
+
+def test_lookup_honours_cache_ttl(tmp_path, monkeypatch):
+    import os
+    import time
+
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    gen_cache.store("10 diabetic patients", "mock", "R4B", _CODE)
+
+    assert gen_cache.lookup("25 diabetic patients", "mock", "R4B", cache_ttl=3600) is not None
+
+    stale = time.time() - 7200
+    for path in tmp_path.iterdir():
+        os.utime(path, (stale, stale))
+    assert gen_cache.lookup("25 diabetic patients", "mock", "R4B", cache_ttl=3600) is None
@@ -0,0 +1,47 @@
+"""Tests for the on-disk LLM artifact cache."""
+
+import time
+
+from fhir_synth import llm_cache
+
+
+def test_cache_key_is_stable_and_distinct():
+    assert llm_cache.cache_key("gpt-4", "10 patients") == llm_cache.cache_key(
+        "gpt-4", "10 patients"
+    )
+    assert llm_cache.cache_key("gpt-4", "10 patients") != llm_cache.cache_key(
+        "gpt-4o", "10 patients"
+    )
+    assert llm_cache.cache_key("gpt-4", "10 patients") != llm_cache.cache_key(
+        "gpt-4", "20 patients"
+    )
+
+
+def test_get_or_compute_caches(tmp_path, monkeypatch):
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "print('hi')"
+
+    key = llm_cache.cache_key("mock", "a prompt")
+    assert llm_cache.get_or_compute(key, compute) == "print('hi')"
+    assert llm_cache.get_or_compute(key, compute) == "print('hi')"
+    assert len(calls) == 1
+    assert (tmp_path / f"{key}.py").exists()
+
+
+def test_get_or_compute_ttl_expires(tmp_path, monkeypatch):
+    monkeypatch.setenv("FHIR_SYNTH_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "x = 1"
+
+    key = llm_cache.cache_key("mock", "expiring prompt")
+    llm_cache.get_or_compute(key, compute, ttl=0.01)
+    time.sleep(0.05)
+    llm_cache.get_or_compute(key, compute, ttl=0.01)
+    assert len(calls) == 2
@@ -0,0 +1,67 @@
+"""Tests for the template fast path that bypasses the LLM."""
+
+import ast
+
+import pytest
+
+from fhir_synth import program_cache
+
+
+def _run(code: str) -> list[dict]:
+    namespace: dict = {}
+    exec(code, namespace)
+    return namespace["generate_resources"]()
+
+
+def test_miss_returns_none_for_freeform_prompts():
+    assert program_cache.lookup("an ER visit with troponin trending and admission") is None
+    assert program_cache.lookup("patients") is None
+    assert program_cache.lookup("") is None
+
+
+def test_plain_patients_template():
+    code = program_cache.lookup("generate 3 patients")
+    assert code is not None
+    ast.parse(code)
+    resources = _run(code)
+    assert len(resources) == 3
+    assert all(r["resourceType"] == "Patient" for r in resources)
+
+
+def test_condition_template():
+    code = program_cache.lookup("10 diabetic patients")
+    assert code is not None
+    resources = _run(code)
+    conditions = [r for r in resources if r["resourceType"] == "Condition"]
+    assert len(conditions) == 10
+    assert conditions[0]["code"]["text"] == "diabetic"
+    assert conditions[0]["subject"]["reference"] == "Patient/pat-1"
+
+
+def test_condition_and_observation_template():
+    code = program_cache.lookup("2 copd patients with fev1 observations")
+    assert code is not None
+    resources = _run(code)
+    by_type: dict[str, int] = {}
+    for r in resources:
+        by_type[r["resourceType"]] = by_type.get(r["resourceType"], 0) + 1
+    assert by_type == {"Patient": 2, "Condition": 2, "Observation": 2}
+
+
+def test_condition_capture_fails_over_on_resource_nouns():
+    """A condition capture ending in a resource noun falls through to the LLM.
+
+    "10 patients with hba1c observations" asks for Observation resources;
+    the condition-only template would bake "hba1c observations" into a
+    Condition's code.text and generate zero Observations.
+    """
+    assert program_cache.lookup("10 patients with hba1c observations") is None
+    assert program_cache.lookup("5 patients with encounters") is None
+    assert program_cache.lookup("3 patients with medication requests") is None
+
+
+@pytest.mark.parametrize("version", ["R4B", "STU3"])
+def test_fhir_version_threads_into_imports(version):
+    code = program_cache.lookup("1 patient", fhir_version=version)
+    assert code is not None
+    assert f"fhir.resources.{version}" in code